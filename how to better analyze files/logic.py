@@ -1,34 +1,254 @@
+import logging
+import operator
+import os
 import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import reduce
+from typing import Callable, NamedTuple
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+logger = logging.getLogger(__name__)
+
+# ==========================================
+# KEYWORD SETS (scanned in a single pass)
+# ==========================================
+_LOI_KEYWORDS = frozenset({"letter of intent", "term sheet", "memorandum of understanding", "non-binding"})
+_SPA_KEYWORDS = frozenset({"stock purchase agreement", "asset purchase agreement", "merger agreement", "indemnification"})
+_BINDING_KEYWORDS = frozenset({"non-binding", "not binding"})
+_VAGUE_PRICE_KEYWORDS = frozenset({"subject to further discussion", "to be determined"})
+_DD_SCOPE_KEYWORDS = frozenset({"financial statements", "legal"})
+_REQUIRED_CLAUSES = ("material adverse change", "liability cap", "indemnification", "employee benefits")
+
+_ALL_KEYWORDS = (_LOI_KEYWORDS | _SPA_KEYWORDS | _BINDING_KEYWORDS | _VAGUE_PRICE_KEYWORDS
+                 | _DD_SCOPE_KEYWORDS | frozenset(_REQUIRED_CLAUSES))
+
+# Every keyword owns one bit of the scan's found mask
+_KEYWORDS_BY_BIT = _REQUIRED_CLAUSES + tuple(sorted(_ALL_KEYWORDS - frozenset(_REQUIRED_CLAUSES)))
+_KEYWORD_BITS = {kw: 1 << i for i, kw in enumerate(_KEYWORDS_BY_BIT)}
+
+
+def _mask(keywords):
+    return reduce(operator.or_, (_KEYWORD_BITS[kw] for kw in keywords), 0)
+
+
+_LOI_MASK = _mask(_LOI_KEYWORDS)
+_SPA_MASK = _mask(_SPA_KEYWORDS)
+_BINDING_MASK = _mask(_BINDING_KEYWORDS)
+_VAGUE_PRICE_MASK = _mask(_VAGUE_PRICE_KEYWORDS)
+
+# One alternation over every keyword; longest first so overlapping phrases prefer the full match.
+# Scans run over the latin-1 encoded text (see MA_Contract_Analyzer.text_b), so patterns are bytes.
+_BIT_BY_BYTES = {kw.encode(): bit for kw, bit in _KEYWORD_BITS.items()}
+_KEYWORD_RE = re.compile(b"|".join(re.escape(kw) for kw in sorted(_BIT_BY_BYTES, key=len, reverse=True)))
+
+# Every latin-1 character str's \s matches, so byte scans treat NBSP (\xa0) and NEL (\x85)
+# from PDF/Word extraction as whitespace too
+_WHITESPACE = frozenset(b" \t\n\r\f\v\x1c\x1d\x1e\x1f\x85\xa0")
+# Whitespace above latin-1 (thin, narrow no-break, ideographic spaces...) becomes a plain
+# space before the text is narrowed, instead of the "?" latin-1 'replace' would leave
+_WIDE_WHITESPACE = {cp: " " for cp in range(0x100, 0x3001) if chr(cp).isspace()}
+# Likewise fullwidth, Arabic-Indic and other decimal digits become ASCII, so "\uff13\uff10 days"
+# still reads as 30 days
+_WIDE_DIGITS = {
+    cp: str(unicodedata.decimal(chr(cp)))
+    for cp in range(0x100, 0x20000)
+    if unicodedata.decimal(chr(cp), None) is not None
+}
+_NARROW = {**_WIDE_WHITESPACE, **_WIDE_DIGITS}
+_DIGITS = frozenset(b"0123456789")
+
+
+@dataclass(slots=True)
+class Flag:
+    """A single finding; serialized to a dict only when results are dumped"""
+    severity: str
+    issue: str
+    recommendation: str = ""
+
+    def to_dict(self):
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class _NoticeFlag(Flag):
+    """A finding with no recommendation; dumped with the original {"severity", "msg"} keys"""
+
+    def to_dict(self):
+        return {"severity": self.severity, "msg": self.issue}
+
+
+class _Engine(NamedTuple):
+    """Compiled scan artifacts; built once and only read afterwards, so safe to share across threads"""
+    keyword_re: re.Pattern
+    bit_by_bytes: dict
+
+
+def _scan_keywords(engine, text_b):
+    """Walk the text once and return the bitmask of keywords found"""
+    # findall/set/map/reduce all run in C; no Python bytecode executes per hit
+    return reduce(operator.or_, map(engine.bit_by_bytes.__getitem__, set(engine.keyword_re.findall(text_b))), 0)
+
+
+def _find_days(text_b):
+    r"""
+    Day count within the same sentence as "exclusivity", or None.
+    Byte-level equivalent of r'exclusivity[^.]{0,200}?(\d+)\s+days' on the str: bytes.find
+    locates the anchors and the digits are read backwards from "days".
+    """
+    start = text_b.find(b"exclusivity")
+    while start >= 0:
+        window = start + len(b"exclusivity")
+        sentence_end = text_b.find(b".", window)
+        if sentence_end < 0:
+            sentence_end = len(text_b)
+        i = text_b.find(b"days", window, sentence_end)
+        while i >= 0:
+            j = i
+            while j > window and text_b[j - 1] in _WHITESPACE:
+                j -= 1
+            k = j
+            while k > window and text_b[k - 1] in _DIGITS:
+                k -= 1
+            if k < j < i and k - window <= 200:
+                return int(text_b[k:j])
+            if k - window > 200:
+                break
+            i = text_b.find(b"days", i + 4, sentence_end)
+        start = text_b.find(b"exclusivity", window)
+    return None
+
+
+# ==========================================
+# RULE TABLES (compiled into straight-line analyzers)
+# ==========================================
+class _MaskRule(NamedTuple):
+    """Fires when a bit of any_mask was found (if any_mask is set) and no bit of none_mask was"""
+    any_mask: int
+    none_mask: int
+    severity: str
+    issue: str
+    recommendation: str
+
+
+def _check_exclusivity(text_b):
+    # Find the number of days near the word "exclusivity"
+    days = _find_days(text_b)
+    if days is not None and days < 45:
+        return Flag(
+            severity="MEDIUM",
+            issue=f"Short Exclusivity Period ({days} days)",
+            recommendation="Extend to 60-90 days to allow for full due diligence."
+        )
+    return None
+
+
+# LOGIC SPECIFIC TO LOI (What you missed)
+_LOI_RULES = (
+    # CHECK 1: BINDING VS NON-BINDING (The "Fatal Error" check)
+    # We look for a disclaimer stating parts are non-binding.
+    _MaskRule(0, _BINDING_MASK, "CRITICAL", "Risk of Inadvertent Binding Contract",
+              "Add explicit language stating the LOI is non-binding except for Exclusivity/Confidentiality."),
+    # CHECK 2: PRICE CERTAINTY
+    # Detecting vague price mechanisms
+    _MaskRule(_VAGUE_PRICE_MASK, 0, "HIGH", "Undefined Purchase Price",
+              "Set a base valuation (e.g., '$10M' or '5x EBITDA') to avoid wasting time."),
+    # CHECK 3: EXCLUSIVITY DURATION
+    _check_exclusivity,
+    # CHECK 4: DUE DILIGENCE SCOPE
+    # Check if the scope is limited to just financials
+    _MaskRule(_KEYWORD_BITS["financial statements"], _KEYWORD_BITS["legal"], "MEDIUM", "Restrictive Due Diligence Scope",
+              "Expand scope to include legal, IP, HR, and tax documents."),
+)
+
+# LOGIC SPECIFIC TO SPA (What you ran before)
+_SPA_RULES = tuple(
+    _MaskRule(0, _KEYWORD_BITS[clause], "HIGH", f"Missing {clause.title()} Clause", f"Draft a standard {clause} provision.")
+    for clause in _REQUIRED_CLAUSES
+)
+
+
+def _generate_analyzer(name, rules) -> Callable:
+    """
+    Emit and compile a function that applies rules in order with every mask and
+    message inlined as a constant; callable rules are invoked as text_b -> Flag | None.
+    """
+    namespace = {"Flag": Flag}
+    lines = [f"def {name}(found_mask, text_b):", "    flags = []"]
+    for i, rule in enumerate(rules):
+        if isinstance(rule, _MaskRule):
+            conditions = []
+            if rule.any_mask:
+                conditions.append(f"found_mask & {rule.any_mask:#x}")
+            if rule.none_mask:
+                conditions.append(f"not found_mask & {rule.none_mask:#x}")
+            lines.append(f"    if {' and '.join(conditions) or 'True'}:")
+            lines.append(f"        flags.append(Flag({rule.severity!r}, {rule.issue!r}, {rule.recommendation!r}))")
+        else:
+            namespace[f"_check_{i}"] = rule
+            lines.append(f"    flag = _check_{i}(text_b)")
+            lines.append("    if flag is not None:")
+            lines.append("        flags.append(flag)")
+    lines.append("    return flags")
+    exec(compile("\n".join(lines) + "\n", f"<generated {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_analyze_LOI = _generate_analyzer("_analyze_LOI", _LOI_RULES)
+_analyze_SPA = _generate_analyzer("_analyze_SPA", _SPA_RULES)
+
 
 class MA_Contract_Analyzer:
-    def __init__(self, document_text):
-        self.text = document_text.lower()
+    # Shared by every instance; per-document state lives on the instance only
+    _ENGINE = _Engine(keyword_re=_KEYWORD_RE, bit_by_bytes=_BIT_BY_BYTES)
+
+    def __init__(self, document_text, normalized=False):
+        if not document_text.isascii():
+            # Narrow to latin-1 up front: a single emoji or supplementary character would
+            # otherwise widen every copy of the text to four bytes per character
+            document_text = document_text.translate(_NARROW).encode('latin-1', 'replace').decode('latin-1')
+        # Callers that already hold lowercased text can skip the extra copy
+        self.text = document_text if normalized else document_text.lower()
+        # One byte per character for the scanners
+        self.text_b = self.text.encode('latin-1', 'replace')
         self.doc_type = None
         self.flags = []
+        self.found_mask = 0
 
     def run_analysis(self):
+        # STEP 0: SINGLE KEYWORD PASS OVER THE DOCUMENT
+        self.found_mask = _scan_keywords(self._ENGINE, self.text_b)
+
         # STEP 1: CLASSIFY THE DOCUMENT
         self.doc_type = self.classify_document()
-        print(f"Document Identified as: {self.doc_type}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Document Identified as: %s", self.doc_type)
 
         # STEP 2: ROUTE TO CORRECT LOGIC
-        if self.doc_type == "LOI":
-            self.analyze_loi()
-        elif self.doc_type == "DEFINITIVE_AGREEMENT":
-            self.analyze_spa()
+        handler = self._HANDLERS.get(self.doc_type)
+        if handler is not None:
+            handler(self)
         else:
-            self.flags.append({"severity": "CRITICAL", "msg": "Unknown document type."})
+            self.flags.append(_NoticeFlag(severity="CRITICAL", issue="Unknown document type."))
 
         return self.flags
 
     def classify_document(self):
         # Simple keyword weighting for classification
-        loi_keywords = ["letter of intent", "term sheet", "memorandum of understanding", "non-binding"]
-        spa_keywords = ["stock purchase agreement", "asset purchase agreement", "merger agreement", "indemnification"]
-        
-        if any(x in self.text for x in loi_keywords):
+        if self.found_mask & _LOI_MASK:
             return "LOI"
-        elif any(x in self.text for x in spa_keywords):
+        elif self.found_mask & _SPA_MASK:
             return "DEFINITIVE_AGREEMENT"
         return "UNKNOWN"
 
@@ -36,68 +256,43 @@ class MA_Contract_Analyzer:
     # LOGIC SPECIFIC TO LOI (What you missed)
     # ==========================================
     def analyze_loi(self):
-        print("Running LOI specific checks...")
-        
-        # CHECK 1: BINDING VS NON-BINDING (The "Fatal Error" check)
-        # We look for a disclaimer stating parts are non-binding.
-        if "non-binding" not in self.text and "not binding" not in self.text:
-            self.flags.append({
-                "severity": "CRITICAL",
-                "issue": "Risk of Inadvertent Binding Contract",
-                "recommendation": "Add explicit language stating the LOI is non-binding except for Exclusivity/Confidentiality."
-            })
-
-        # CHECK 2: PRICE CERTAINTY
-        # Detecting vague price mechanisms
-        if "subject to further discussion" in self.text or "to be determined" in self.text:
-             self.flags.append({
-                "severity": "HIGH",
-                "issue": "Undefined Purchase Price",
-                "recommendation": "Set a base valuation (e.g., '$10M' or '5x EBITDA') to avoid wasting time."
-            })
-
-        # CHECK 3: EXCLUSIVITY DURATION
-        # Regex to find the number of days near the word "exclusivity"
-        match = re.search(r'(\d+)\s+days', self.text)
-        if match:
-            days = int(match.group(1))
-            if days < 45:
-                self.flags.append({
-                    "severity": "MEDIUM",
-                    "issue": f"Short Exclusivity Period ({days} days)",
-                    "recommendation": "Extend to 60-90 days to allow for full due diligence."
-                })
-
-        # CHECK 4: DUE DILIGENCE SCOPE
-        # Check if the scope is limited to just financials
-        if "financial statements" in self.text and "legal" not in self.text:
-            self.flags.append({
-                "severity": "MEDIUM",
-                "issue": "Restrictive Due Diligence Scope",
-                "recommendation": "Expand scope to include legal, IP, HR, and tax documents."
-            })
+        logger.debug("Running LOI specific checks...")
+        self.flags.extend(_analyze_LOI(self.found_mask, self.text_b))
 
     # ==========================================
     # LOGIC SPECIFIC TO SPA (What you ran before)
     # ==========================================
     def analyze_spa(self):
-        print("Running SPA specific checks...")
-        
-        # This is where your PREVIOUS analysis logic belongs
-        required_clauses = ["material adverse change", "liability cap", "indemnification", "employee benefits"]
-        
-        for clause in required_clauses:
-            if clause not in self.text:
-                self.flags.append({
-                    "severity": "HIGH", 
-                    "issue": f"Missing {clause.title()} Clause",
-                    "recommendation": f"Draft a standard {clause} provision."
-                })
+        logger.debug("Running SPA specific checks...")
+        self.flags.extend(_analyze_SPA(self.found_mask, self.text_b))
+
+    # Document type -> analyzer; add new document types here
+    _HANDLERS = {
+        "LOI": analyze_loi,
+        "DEFINITIVE_AGREEMENT": analyze_spa,
+    }
+
+
+# ==========================================
+# BATCH ANALYSIS
+# ==========================================
+def _analyze_document(document_text):
+    return MA_Contract_Analyzer(document_text).run_analysis()
+
+
+def analyze_many(docs, workers=None):
+    """Analyze documents in parallel and return one flag list per document, in input order"""
+    # re holds the GIL while matching, so documents fan out to processes rather than threads
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        return list(pool.map(_analyze_document, docs))
 
 # ==========================================
 # TEST WITH YOUR DOCUMENT TEXT
 # ==========================================
-doc_text = """
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
+    doc_text = """
 Letter of Intent – Acme Corp. (Buyer) & BrightFuture Ltd. (Seller)
 1. Intent: Buyer intends to acquire 100 % of Seller’s equity.
 2. Purchase Price: The purchase price will be determined based on industry standard adjustments and is subject to further discussion.
@@ -107,8 +302,7 @@ Letter of Intent – Acme Corp. (Buyer) & BrightFuture Ltd. (Seller)
 6. Governing Law: This LOI shall be governed by the laws of the State of Delaware.
 """
 
-analyzer = MA_Contract_Analyzer(doc_text)
-results = analyzer.run_analysis()
+    analyzer = MA_Contract_Analyzer(doc_text)
+    results = analyzer.run_analysis()
 
-import json
-print(json.dumps(results, indent=2))
\ No newline at end of file
+    print(_dumps([flag.to_dict() for flag in results]))
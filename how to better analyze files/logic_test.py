@@ -0,0 +1,114 @@
+import re
+import unittest
+
+from logic import MA_Contract_Analyzer, _find_days
+
+# The str regex the byte scanner replaced; its \s is Unicode-aware
+_DAYS_REFERENCE = re.compile(r'exclusivity[^.]{0,200}?(\d+)\s+days')
+
+_SEPARATORS = (" ", "  ", "\t", "\n", "\xa0", "\x85", "\x1c", " ", " ", "　", " \xa0\n", "", "-")
+
+
+def _reference_days(text):
+    match = _DAYS_REFERENCE.search(text.lower())
+    return int(match.group(1)) if match else None
+
+
+class TestFindDays(unittest.TestCase):
+
+    def test_matches_str_regex_for_every_separator(self):
+        """The byte scan agrees with the str regex whatever whitespace sits between number and "days" """
+        for sep in _SEPARATORS:
+            for text in (
+                f"Exclusivity: Seller will not negotiate with other parties for 30{sep}days.",
+                f"Exclusivity. Seller will not negotiate for 30{sep}days.",
+                f"Exclusivity period of 14{sep}business days or 60{sep}days.",
+            ):
+                with self.subTest(sep=sep, text=text):
+                    analyzer = MA_Contract_Analyzer(text)
+                    self.assertEqual(_find_days(analyzer.text_b), _reference_days(text))
+
+    def test_matches_str_regex_for_wide_digits(self):
+        """Decimal digits above latin-1 are read as their ASCII values, as the str regex's \\d does"""
+        for digits in ("\uff13\uff10", "\u0663\u0660", "\u0969\u0966", "3\uff10"):
+            text = f"Exclusivity: {digits} days."
+            with self.subTest(digits=digits):
+                analyzer = MA_Contract_Analyzer(text)
+                self.assertEqual(_find_days(analyzer.text_b), _reference_days(text))
+                self.assertEqual(_find_days(analyzer.text_b), 30)
+
+    def test_nbsp_raises_short_exclusivity(self):
+        """PDF and Word extraction emit NBSP between the number and "days" """
+        analyzer = MA_Contract_Analyzer(
+            "Letter of Intent. Non-binding. Exclusivity: Seller will not negotiate for 30\xa0days."
+        )
+        issues = [flag.issue for flag in analyzer.run_analysis()]
+        self.assertIn("Short Exclusivity Period (30 days)", issues)
+
+
+
+_LOI_TEXT = """
+Letter of Intent \u2013 Acme Corp. (Buyer) & BrightFuture Ltd. (Seller)
+1. Intent: Buyer intends to acquire 100 % of Seller\u2019s equity.
+2. Purchase Price: The purchase price will be determined based on industry standard adjustments and is subject to further discussion.
+3. Due Diligence: Seller will provide financial statements for the past three years.
+4. Confidentiality: Both parties agree to keep discussions confidential.
+5. Exclusivity: Seller will not negotiate with other parties for 30 days.
+6. Governing Law: This LOI shall be governed by the laws of the State of Delaware.
+"""
+
+_SPA_TEXT = """
+Stock Purchase Agreement between Acme Corp. and BrightFuture Ltd.
+Article 7. Indemnification: Seller shall indemnify Buyer for breaches of representations.
+Article 8. Employee Benefits: Buyer assumes the existing plans.
+"""
+
+
+class TestRunAnalysis(unittest.TestCase):
+    """Classification and the order flags are raised in, per routing path"""
+
+    def _run(self, text):
+        analyzer = MA_Contract_Analyzer(text)
+        flags = analyzer.run_analysis()
+        return analyzer.doc_type, [(flag.severity, flag.issue) for flag in flags]
+
+    def test_loi(self):
+        self.assertEqual(self._run(_LOI_TEXT), ("LOI", [
+            ("CRITICAL", "Risk of Inadvertent Binding Contract"),
+            ("HIGH", "Undefined Purchase Price"),
+            ("MEDIUM", "Short Exclusivity Period (30 days)"),
+            ("MEDIUM", "Restrictive Due Diligence Scope"),
+        ]))
+
+    def test_loi_keywords_win_over_spa_keywords(self):
+        doc_type, _ = self._run("Non-binding term sheet for a merger agreement with indemnification.")
+        self.assertEqual(doc_type, "LOI")
+
+    def test_definitive_agreement(self):
+        self.assertEqual(self._run(_SPA_TEXT), ("DEFINITIVE_AGREEMENT", [
+            ("HIGH", "Missing Material Adverse Change Clause"),
+            ("HIGH", "Missing Liability Cap Clause"),
+        ]))
+
+    def test_definitive_agreement_missing_every_clause(self):
+        self.assertEqual(self._run("Merger Agreement."), ("DEFINITIVE_AGREEMENT", [
+            ("HIGH", "Missing Material Adverse Change Clause"),
+            ("HIGH", "Missing Liability Cap Clause"),
+            ("HIGH", "Missing Indemnification Clause"),
+            ("HIGH", "Missing Employee Benefits Clause"),
+        ]))
+
+    def test_unknown(self):
+        self.assertEqual(self._run("Minutes of the quarterly board meeting."), ("UNKNOWN", [
+            ("CRITICAL", "Unknown document type."),
+        ]))
+
+    def test_dumped_flags_keep_their_original_keys(self):
+        unknown = MA_Contract_Analyzer("Minutes of the quarterly board meeting.").run_analysis()
+        self.assertEqual([flag.to_dict() for flag in unknown], [{"severity": "CRITICAL", "msg": "Unknown document type."}])
+        loi = MA_Contract_Analyzer(_LOI_TEXT).run_analysis()
+        self.assertEqual(list(loi[0].to_dict()), ["severity", "issue", "recommendation"])
+
+
+if __name__ == "__main__":
+    unittest.main()
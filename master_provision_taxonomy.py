@@ -7,44 +7,114 @@ Author: Contract Analysis Platform
 Version: 1.0.0
 """
 
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Optional
+from enum import Enum, IntEnum, IntFlag
+from functools import lru_cache
+from itertools import compress
+from types import MappingProxyType
+from typing import Callable, Mapping, NamedTuple, Optional
+import hashlib
+import os
 import re
+import sys
+import threading
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
+
+try:
+    import re2  # Optional: google-re2, linear-time matching and multi-pattern sets
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan  # Optional: Intel Hyperscan, SIMD multi-pattern block scanning
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick  # Optional: pyahocorasick, one-pass literal phrase matching
+except ImportError:
+    ahocorasick = None
 
 
 # =============================================================================
 # ENUMS AND BASE CLASSES
 # =============================================================================
 
-class Severity(Enum):
-    CRITICAL = "critical"
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
-    INFO = "info"
+class Severity(IntEnum):
+    CRITICAL = 4
+    HIGH = 3
+    MEDIUM = 2
+    LOW = 1
+    INFO = 0
+    
+    @property
+    def label(self) -> str:
+        return _SEVERITY_LABELS[self]
 
 
-class Category(Enum):
-    MISSING_PROVISION = "missing_provision"
-    VAGUE_LANGUAGE = "vague_language"
-    UNFAVORABLE_TERMS = "unfavorable_terms"
-    STRUCTURAL_ISSUE = "structural_issue"
-    COMPLIANCE_RISK = "compliance_risk"
-    FINANCIAL_RISK = "financial_risk"
-    TIMELINE_ISSUE = "timeline_issue"
-    AMBIGUITY = "ambiguity"
-    NON_STANDARD = "non_standard"
-    INCOMPLETE_DEFINITION = "incomplete_definition"
+_SEVERITY_LABELS = ("info", "low", "medium", "high", "critical")
 
 
-class DocumentType(Enum):
-    LOI = "letter_of_intent"
-    TERM_SHEET = "term_sheet"
-    STOCK_PURCHASE = "stock_purchase_agreement"
-    ASSET_PURCHASE = "asset_purchase_agreement"
-    MERGER_AGREEMENT = "merger_agreement"
-    UNKNOWN = "unknown"
+class Category(IntEnum):
+    MISSING_PROVISION = 0
+    VAGUE_LANGUAGE = 1
+    UNFAVORABLE_TERMS = 2
+    STRUCTURAL_ISSUE = 3
+    COMPLIANCE_RISK = 4
+    FINANCIAL_RISK = 5
+    TIMELINE_ISSUE = 6
+    AMBIGUITY = 7
+    NON_STANDARD = 8
+    INCOMPLETE_DEFINITION = 9
+    
+    @property
+    def label(self) -> str:
+        return _CATEGORY_LABELS[self]
+
+
+_CATEGORY_LABELS = (
+    "missing_provision",
+    "vague_language",
+    "unfavorable_terms",
+    "structural_issue",
+    "compliance_risk",
+    "financial_risk",
+    "timeline_issue",
+    "ambiguity",
+    "non_standard",
+    "incomplete_definition",
+)
+
+
+class DocumentType(IntFlag):
+    """One bit per type, so a set of document types is a single int mask"""
+    LOI = 1 << 0
+    TERM_SHEET = 1 << 1
+    STOCK_PURCHASE = 1 << 2
+    ASSET_PURCHASE = 1 << 3
+    MERGER_AGREEMENT = 1 << 4
+    UNKNOWN = 1 << 5
+    
+    @property
+    def label(self) -> str:
+        return _DOCUMENT_TYPE_LABELS[self]
+
+
+_DOCUMENT_TYPE_LABELS = {
+    DocumentType.LOI: "letter_of_intent",
+    DocumentType.TERM_SHEET: "term_sheet",
+    DocumentType.STOCK_PURCHASE: "stock_purchase_agreement",
+    DocumentType.ASSET_PURCHASE: "asset_purchase_agreement",
+    DocumentType.MERGER_AGREEMENT: "merger_agreement",
+    DocumentType.UNKNOWN: "unknown",
+}
 
 
 class PartyRole(Enum):
@@ -53,7 +123,325 @@ class PartyRole(Enum):
     NEUTRAL = "neutral"
 
 
-@dataclass
+class MatchKind(IntFlag):
+    """Which of a provision's pattern lists matched a document"""
+    PRESENCE = 1
+    VAGUE = 2
+    PROBLEMATIC = 4
+
+
+# =============================================================================
+# PATTERN HELPERS
+# =============================================================================
+
+_WHITESPACE_RUN = re.compile(r"\s+")
+_ESCAPE_OR_TEXT = re.compile(r"\\.|[^\\]+", re.DOTALL)
+
+# Bounds how many phrases one pattern may expand to before it stays a regex
+_MAX_LITERAL_EXPANSION = 32
+
+# Shorter required terms are present in nearly every document and filter nothing
+_MIN_REQUIRED_TERM = 3
+
+# Hyperscan and RE2 treat \w, \d and \b as ASCII-only, differ from re on $ and have
+# no lookarounds, so patterns using those (or literal whitespace) always run on re.
+# Their \s is ASCII-only too, so they scan a copy of the text with re's other
+# whitespace characters mapped to a space, which keeps \s and . identical.
+_ENGINE_UNSAFE = re.compile(r"\\[wWdDbBAZ]|\(\?[=!<]|(?<!\\)\$|\s")
+_ENGINE_WHITESPACE = str.maketrans(dict.fromkeys(
+    "\x0b\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005"
+    "\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000",
+    " ",
+))
+# What the engines scan: lone surrogates (broken pairs from PDF or JSON extraction) cannot
+# be encoded as UTF-8 for them, and no library pattern tells one from U+FFFD
+_ENGINE_TEXT = {**_ENGINE_WHITESPACE, **dict.fromkeys(range(0xD800, 0xE000), "\ufffd")}
+# A counted repeat of . (the bounded gaps in the library's patterns) expands into a
+# large UTF-8 automaton: Hyperscan takes seconds to compile each one, and RE2's DFA
+# can exhaust its memory budget, logging on every search (and a Set search then
+# reports no match). Both engines leave those patterns to re.
+_BOUNDED_GAP = re.compile(r"(?<!\\)\.\{")
+
+
+def _strip_inline_flags(pattern: str) -> str:
+    """
+    Drops a leading (?i) from a caller-supplied pattern; library patterns are
+    written without it, lowercased, and run against lowercased text
+    """
+    return pattern[4:] if pattern.startswith("(?i)") else pattern
+
+
+def _lower_pattern(pattern: str) -> str:
+    r"""Lowercases the literal text of a pattern, leaving escapes such as \S, \D or \W intact"""
+    return _ESCAPE_OR_TEXT.sub(lambda m: m[0] if m[0].startswith("\\") else m[0].lower(), pattern)
+
+
+def _normalize_source(pattern: str) -> str:
+    """The form every library pattern is compiled in: no inline flags, lowercase literals"""
+    return _lower_pattern(_strip_inline_flags(pattern))
+
+
+# Feature flag: compile library patterns RE2 can run identically with re2 (linear
+# time, no backtracking) instead of re. Needs the optional re2 package and must be
+# set before the library is built. Scans then run on _scan_text(), whose whitespace
+# translation is exact for every pattern without literal whitespace characters and
+# whose lone surrogates become U+FFFD, which re2 can encode.
+USE_RE2 = False
+
+
+def _compile_source(source: str):
+    """Compiles a normalized source with re2 when USE_RE2 allows it, otherwise with re"""
+    if USE_RE2 and re2 is not None and not _ENGINE_UNSAFE.search(source) and not _BOUNDED_GAP.search(source):
+        try:
+            return re2.compile(source)
+        except re2.error:
+            pass
+    return re.compile(source)
+
+
+def _scan_text(text: str) -> str:
+    """
+    The form of a document every compiled library pattern searches. It has
+    the same length as text, so match offsets are offsets into the original.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # U+0130 is the one character whose lowercase is two code points; map it
+        # to "i" as re.IGNORECASE does, keeping offsets and matches the same
+        lowered = text.replace("\u0130", "i").lower()
+    if not lowered.isascii() and ("\u0131" in lowered or "\u017f" in lowered):
+        # Dotless i and long s are lowercase already, but re.IGNORECASE matches them to i and s
+        lowered = lowered.replace("\u0131", "i").replace("\u017f", "s")
+    return lowered.translate(_ENGINE_TEXT) if USE_RE2 else lowered
+
+
+# Normalized pattern source -> compiled pattern, shared by every DetectionPattern.
+# Keys are _normalize_source() output, so "(?i)X" and "x" share one compiled object.
+_COMPILED: dict = {}
+
+
+def _compile(pattern: str) -> re.Pattern:
+    """
+    Compiles a library pattern once per process. Patterns are compiled
+    lowercased and without IGNORECASE, so they must search _scan_text() output.
+    """
+    source = _normalize_source(pattern)
+    compiled = _COMPILED.get(source)
+    if compiled is None:
+        compiled = _COMPILED.setdefault(source, _compile_source(source))
+    return compiled
+
+
+def _compile_union(patterns) -> Optional[re.Pattern]:
+    """One alternation over several library patterns, so a presence test is a single search()"""
+    if not patterns:
+        return None
+    return _compile("|".join(f"(?:{_normalize_source(p)})" for p in patterns))
+
+
+def _expand_literals(items) -> Optional[list]:
+    r"""
+    Expands parsed regex items into the lowercase strings they can match, with
+    each \s+ run written as a single space. Returns None for anything else
+    (anchors, classes, optional parts, literal whitespace) or if it grows too large.
+    """
+    results = [""]
+    for op, av in items:
+        if op is _sre_parse.LITERAL and not chr(av).isspace():
+            options = (chr(av).lower(),)
+        elif op is _sre_parse.IN and all(o is _sre_parse.LITERAL and not chr(a).isspace() for o, a in av):
+            options = tuple(chr(a).lower() for _, a in av)
+        elif (op is _sre_parse.MAX_REPEAT and av[0] == 1 and av[1] == _sre_parse.MAXREPEAT
+                and list(av[2]) == [(_sre_parse.IN, [(_sre_parse.CATEGORY, _sre_parse.CATEGORY_SPACE)])]):
+            options = (" ",)
+        elif op is _sre_parse.SUBPATTERN:
+            options = _expand_literals(av[3])
+        elif op is _sre_parse.BRANCH:
+            options = []
+            for branch in av[1]:
+                expanded = _expand_literals(branch)
+                if expanded is None:
+                    return None
+                options.extend(expanded)
+        else:
+            return None
+        if options is None:
+            return None
+        results = [prefix + option for prefix in results for option in options]
+        if len(results) > _MAX_LITERAL_EXPANSION:
+            return None
+    return results
+
+
+def _literal_alternatives(pattern: str) -> Optional[tuple]:
+    r"""
+    Returns the literal phrases a pattern matches when it is only alternations
+    of plain text joined by \s+ (e.g. (letter\s+of\s+intent|loi)), or None
+    when the pattern needs the regex engine. Phrases are meant to be found in
+    _fold_text() output.
+    """
+    try:
+        parsed = _sre_parse.parse(_strip_inline_flags(pattern))
+    except re.error:
+        return None
+    expanded = _expand_literals(parsed)
+    return None if expanded is None else tuple(expanded)
+
+
+def _required_factors(items) -> Optional[frozenset]:
+    """
+    Returns lowercase strings of which every match of the parsed items must
+    contain at least one, or None when no such set can be derived.
+    """
+    candidates, run = [], []
+    for op, av in items:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(av).lower())
+            continue
+        if run:
+            candidates.append(frozenset(("".join(run),)))
+            run = []
+        if op is _sre_parse.SUBPATTERN:
+            factors = _required_factors(av[3])
+        elif op is _sre_parse.BRANCH:
+            branches = [_required_factors(branch) for branch in av[1]]
+            factors = None if None in branches else frozenset().union(*branches)
+        elif op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT) and av[0] >= 1:
+            factors = _required_factors(av[2])
+        else:
+            factors = None
+        if factors:
+            candidates.append(factors)
+    if run:
+        candidates.append(frozenset(("".join(run),)))
+    # Prefer the set whose shortest string is longest: it rules out the most documents
+    return max(candidates, key=lambda factors: min(map(len, factors)), default=None)
+
+
+@lru_cache(maxsize=None)
+def _required_terms(pattern: str) -> Optional[tuple]:
+    """
+    Substrings of which the lowercased text must contain at least one for
+    pattern to match, or None when the pattern has no usable requirement.
+    """
+    try:
+        factors = _required_factors(_sre_parse.parse(_strip_inline_flags(pattern)))
+    except re.error:
+        return None
+    if not factors or min(map(len, factors)) < _MIN_REQUIRED_TERM:
+        return None
+    return tuple(sorted(factors))
+
+
+def _union_terms(patterns) -> Optional[tuple]:
+    """
+    Required terms of an alternation over patterns: every alternative's own
+    terms, or None when some alternative has none. Built only from
+    _required_terms() of individual library patterns, so each term is in
+    the set _term_automaton() looks for.
+    """
+    terms = set()
+    for pattern in patterns:
+        pattern_terms = _required_terms(pattern)
+        if pattern_terms is None:
+            return None
+        terms.update(pattern_terms)
+    return tuple(sorted(terms)) if terms else None
+
+
+def _fold_text(lowered: str) -> str:
+    """Collapses whitespace runs in lowercased text, the form literal phrases are matched against"""
+    return _WHITESPACE_RUN.sub(" ", lowered)
+
+
+class ScanDocument:
+    """
+    A document prepared for scanning. Every scan_* function accepts one in
+    place of the raw text, so a document checked by several scanners is
+    lowercased once and its derived forms are built at most once.
+    """
+    __slots__ = ("lowered", "_folded", "_engine_text", "_literal_hits", "_terms")
+    
+    def __init__(self, text: str):
+        self.lowered = _scan_text(text)
+        self._folded = None
+        self._engine_text = None
+        self._literal_hits = None
+        self._terms = None
+    
+    @property
+    def folded(self) -> str:
+        """_fold_text() form, for literal phrase matching"""
+        if self._folded is None:
+            self._folded = _fold_text(self.lowered)
+        return self._folded
+    
+    @property
+    def engine_text(self) -> str:
+        """Lowered text with whitespace and lone surrogates narrowed to what the multi-pattern engines accept"""
+        if self._engine_text is None:
+            self._engine_text = self.lowered.translate(_ENGINE_TEXT)
+        return self._engine_text
+    
+    @property
+    def literal_hits(self) -> Optional[set]:
+        """ProvisionIds with a literal presence phrase in the document; None without pyahocorasick"""
+        if self._literal_hits is None:
+            automaton = _literal_automaton()
+            if automaton is None:
+                return None
+            hits = set()
+            for _, pids in automaton.iter(self.folded):
+                hits.update(pids)
+            self._literal_hits = hits
+        return self._literal_hits
+    
+    @property
+    def terms(self):
+        """
+        Answers `term in document.terms` for the library's required terms. With
+        pyahocorasick this is the set of terms found by one automaton pass, so
+        each check is a hash lookup; otherwise it is the lowered text itself.
+        """
+        if self._terms is None:
+            automaton = _term_automaton()
+            if automaton is None:
+                self._terms = self.lowered
+            else:
+                self._terms = {term for _, term in automaton.iter(self.lowered)}
+        return self._terms
+
+
+def _as_document(text) -> ScanDocument:
+    return text if type(text) is ScanDocument else ScanDocument(text)
+
+
+_TUPLE_FIELDS = (
+    "presence_patterns", "vague_patterns", "problematic_patterns", "related_provisions", "sub_checks",
+)
+
+# Equal document-type scopes share one frozenset across all provisions
+_SCOPES: dict = {}
+
+
+def _intern_scope(document_types) -> frozenset:
+    scope = frozenset(document_types)
+    return _SCOPES.setdefault(scope, scope)
+
+
+def _doc_type_mask(document_types) -> int:
+    mask = 0
+    for doc_type in document_types:
+        mask |= doc_type
+    return mask
+
+
+_ALL_DOC_TYPES = _doc_type_mask(DocumentType)
+
+
+# Instances are built once and shared, so identity is their equality and hash;
+# that keeps dict/lru_cache keys cheap without hashing every pattern tuple
+@dataclass(slots=True, frozen=True, eq=False)
 class DetectionPattern:
     """Defines a single detection pattern for a provision"""
     name: str
@@ -61,15 +449,15 @@ class DetectionPattern:
     severity: Severity
     category: Category
     
-    # Detection patterns
-    presence_patterns: list = field(default_factory=list)  # Patterns that indicate presence
+    # Detection patterns, all matched case-insensitively (see _normalize_source)
+    presence_patterns: tuple = ()  # Patterns that indicate presence
     absence_is_flag: bool = False  # If True, flag when NOT found
-    vague_patterns: list = field(default_factory=list)  # Patterns indicating vagueness
-    problematic_patterns: list = field(default_factory=list)  # Red flag patterns
+    vague_patterns: tuple = ()  # Patterns indicating vagueness
+    problematic_patterns: tuple = ()  # Red flag patterns
     
     # Context
-    required_in: list = field(default_factory=list)  # Document types where required
-    recommended_in: list = field(default_factory=list)  # Document types where recommended
+    required_in: frozenset = frozenset()  # Document types where required
+    recommended_in: frozenset = frozenset()  # Document types where recommended
     
     # Scoring
     base_risk_score: int = 5
@@ -80,13 +468,59 @@ class DetectionPattern:
     seller_perspective: str = ""
     
     # Related provisions
-    related_provisions: list = field(default_factory=list)
+    related_provisions: tuple = ()
     
     # Sub-checks (nested requirements)
-    sub_checks: list = field(default_factory=list)
+    sub_checks: tuple = ()
+    
+    # Presence test forms (filled in by __post_init__): patterns that are only literal
+    # phrases become _fold_text() substrings, the rest one single-search union
+    _presence_literals: tuple = field(default=(), init=False, repr=False, compare=False)
+    _presence_union: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+    # Substrings one of which a _presence_union match needs (see _union_terms), or None
+    _presence_terms: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    # required_in, and the document types the provision applies to, as DocumentType masks
+    _required_mask: int = field(default=0, init=False, repr=False, compare=False)
+    _scope_mask: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompile the presence test once so matchers can call .search() directly"""
+        # Sequence fields are stored as tuples even if a caller passes lists
+        for name in _TUPLE_FIELDS:
+            value = getattr(self, name)
+            if type(value) is not tuple:
+                object.__setattr__(self, name, tuple(value))
+        # get_flat_table() packs the score into the low nibble of a byte
+        if not 0 <= self.base_risk_score <= 15:
+            raise ValueError(f"{self.name}: base_risk_score must be 0-15, got {self.base_risk_score}")
+        object.__setattr__(self, "required_in", _intern_scope(self.required_in))
+        object.__setattr__(self, "recommended_in", _intern_scope(self.recommended_in))
+        required_mask = _doc_type_mask(self.required_in)
+        # Provisions without required_in/recommended_in apply to every document type
+        scope_mask = (required_mask | _doc_type_mask(self.recommended_in)) or _ALL_DOC_TYPES
+        object.__setattr__(self, "_required_mask", required_mask)
+        object.__setattr__(self, "_scope_mask", scope_mask)
+        # Names and recommendations are copied into every Flag; keep one shared copy of each
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "recommendation", sys.intern(self.recommendation))
+        # Provision keys repeat across many provisions' cross-references
+        object.__setattr__(self, "related_provisions", tuple(map(sys.intern, self.related_provisions)))
+        object.__setattr__(self, "sub_checks", tuple(map(sys.intern, self.sub_checks)))
+        literals, regex_patterns = [], []
+        for p in self.presence_patterns:
+            alternatives = _literal_alternatives(p)
+            if alternatives is None:
+                regex_patterns.append(p)
+            else:
+                literals.extend(alternatives)
+        object.__setattr__(self, "_presence_literals", tuple(literals))
+        object.__setattr__(self, "_presence_union", _compile_union(regex_patterns))
+        if self._presence_union is not None:
+            object.__setattr__(self, "_presence_terms", _union_terms(regex_patterns))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Flag:
     """Represents a detected issue"""
     provision_name: str
@@ -96,14 +530,46 @@ class Flag:
     description: str
     recommendation: str
     contract_context: str
-    location: Optional[tuple] = None  # (start, end) positions
-    sub_flags: list = field(default_factory=list)
+    location: Optional[tuple[int, int]] = None  # (start, end) positions
+    sub_flags: tuple = ()
+    
+    def __post_init__(self):
+        # Stored as tuples even if a caller passes lists, so a Flag stays hashable
+        if self.location is not None and type(self.location) is not tuple:
+            object.__setattr__(self, "location", tuple(self.location))
+        if type(self.sub_flags) is not tuple:
+            object.__setattr__(self, "sub_flags", tuple(self.sub_flags))
+        object.__setattr__(self, "provision_name", sys.intern(self.provision_name))
+        object.__setattr__(self, "recommendation", sys.intern(self.recommendation))
+    
+    def to_dict(self) -> dict:
+        """JSON-ready representation, with severity/category emitted as labels"""
+        return {
+            "provision_name": self.provision_name,
+            "severity": self.severity.label,
+            "category": self.category.label,
+            "risk_score": self.risk_score,
+            "description": self.description,
+            "recommendation": self.recommendation,
+            "contract_context": self.contract_context,
+            "location": self.location,
+            "sub_flags": [f.to_dict() for f in self.sub_flags],
+        }
 
 
 # =============================================================================
 # COMPREHENSIVE M&A PROVISION DEFINITIONS
 # =============================================================================
 
+# Gaps between the terms of a pattern are written .{0,200}? rather than .*. An
+# unbounded gap lets re backtrack over the rest of the line for every occurrence
+# of the leading term, and text extracted from PDFs often arrives as one long
+# line; two such gaps in one pattern took seconds on an 11 KB line.
+
+# Read-only library shared by the whole process; set on first use
+_PROVISIONS: Optional[Mapping] = None
+
+
 class MAAProvisionLibrary:
     """
     Complete library of M&A provisions to check.
@@ -111,1495 +577,2131 @@ class MAAProvisionLibrary:
     """
     
     @staticmethod
-    def get_all_provisions() -> dict:
-        """Returns all provision checks organized by category"""
+    def get_all_provisions() -> Mapping:
+        """
+        Returns all provision checks organized by category. Built on first use,
+        then the same read-only view is shared by every caller and thread.
+        """
+        global _PROVISIONS
+        if _PROVISIONS is None:
+            _PROVISIONS = MappingProxyType({
+                section: MAAProvisionLibrary.get_section(section) for section in _SECTION_BUILDERS
+            })
+        return _PROVISIONS
+    
+    @staticmethod
+    def get_section(section: str) -> Mapping:
+        """
+        Returns one category's provisions (e.g. "structural"), building only
+        that section when the full library has not been built yet.
+        """
+        if _PROVISIONS is not None:
+            return _PROVISIONS[section]
+        return _get_section(section)
+
+
+@lru_cache(maxsize=None)
+def _get_section(section: str) -> Mapping:
+    return MappingProxyType(_SECTION_BUILDERS[section]())
+
+
+# =============================================================================
+# SECTION 1: STRUCTURAL & DEFINITIONAL
+# =============================================================================
+
+def _build_structural() -> dict:
+    return {
+        "binding_nonbinding_designation": DetectionPattern(
+            name="Binding/Non-Binding Designation",
+            description="LOIs and term sheets must clearly specify which provisions are legally binding and which are non-binding expressions of intent.",
+            severity=Severity.CRITICAL,
+            category=Category.STRUCTURAL_ISSUE,
+            presence_patterns=(
+                r"(?:non-?binding|not\s+binding|no\s+binding|legally\s+binding)",
+                r"(?:binding\s+provisions?|binding\s+obligations?)",
+                r"(?:except\s+for.{0,200}?(?:confidentiality|exclusivity).{0,200}?binding)",
+                r"(?:shall\s+be\s+binding|are\s+binding|is\s+binding)",
+                r"(?:binding\s+effect|legal\s+effect)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.LOI, DocumentType.TERM_SHEET),
+            base_risk_score=9,
+            recommendation="Add explicit section designating which provisions are binding (typically confidentiality, exclusivity, expenses, governing law) and which are non-binding.",
+            buyer_perspective="Without clear designation, buyer may be inadvertently bound to terms intended as negotiable.",
+            seller_perspective="Without clear designation, seller may have limited legal recourse for breaches of intended binding terms.",
+            related_provisions=("confidentiality", "exclusivity", "governing_law")
+        ),
         
-        return {
-            # =================================================================
-            # SECTION 1: STRUCTURAL & DEFINITIONAL
-            # =================================================================
-            "structural": {
-                
-                "binding_nonbinding_designation": DetectionPattern(
-                    name="Binding/Non-Binding Designation",
-                    description="LOIs and term sheets must clearly specify which provisions are legally binding and which are non-binding expressions of intent.",
-                    severity=Severity.CRITICAL,
-                    category=Category.STRUCTURAL_ISSUE,
-                    presence_patterns=[
-                        r"(?i)(non-?binding|not\s+binding|no\s+binding|legally\s+binding)",
-                        r"(?i)(binding\s+provisions?|binding\s+obligations?)",
-                        r"(?i)(except\s+for.*(?:confidentiality|exclusivity).*binding)",
-                        r"(?i)(shall\s+be\s+binding|are\s+binding|is\s+binding)",
-                        r"(?i)(binding\s+effect|legal\s+effect)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.LOI, DocumentType.TERM_SHEET],
-                    base_risk_score=9,
-                    recommendation="Add explicit section designating which provisions are binding (typically confidentiality, exclusivity, expenses, governing law) and which are non-binding.",
-                    buyer_perspective="Without clear designation, buyer may be inadvertently bound to terms intended as negotiable.",
-                    seller_perspective="Without clear designation, seller may have limited legal recourse for breaches of intended binding terms.",
-                    related_provisions=["confidentiality", "exclusivity", "governing_law"]
-                ),
-                
-                "document_type_identification": DetectionPattern(
-                    name="Document Type Identification",
-                    description="Document should clearly identify itself as LOI, Term Sheet, Purchase Agreement, etc.",
-                    severity=Severity.MEDIUM,
-                    category=Category.STRUCTURAL_ISSUE,
-                    presence_patterns=[
-                        r"(?i)(letter\s+of\s+intent|loi)",
-                        r"(?i)(term\s+sheet)",
-                        r"(?i)(stock\s+purchase\s+agreement|spa)",
-                        r"(?i)(asset\s+purchase\s+agreement|apa)",
-                        r"(?i)(merger\s+agreement)",
-                        r"(?i)(agreement\s+and\s+plan\s+of\s+merger)",
-                        r"(?i)(memorandum\s+of\s+understanding|mou)",
-                    ],
-                    absence_is_flag=True,
-                    base_risk_score=5,
-                    recommendation="Ensure document title and introductory paragraph clearly identify the document type.",
-                ),
-                
-                "party_identification": DetectionPattern(
-                    name="Party Identification",
-                    description="All parties must be clearly identified with full legal names, jurisdiction of organization, and roles.",
-                    severity=Severity.CRITICAL,
-                    category=Category.STRUCTURAL_ISSUE,
-                    presence_patterns=[
-                        r"(?i)(buyer|purchaser|acquir[oe]r)",
-                        r"(?i)(seller|target|company)",
-                        r"(?i)(a\s+\w+\s+(corporation|llc|limited|inc\.|company)\s+(organized|incorporated|formed))",
-                        r"(?i)(hereinafter\s+(referred\s+to\s+as\s+)?[\"\']\w+[\"\'])",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.LOI, DocumentType.TERM_SHEET, DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=9,
-                    recommendation="Include full legal names, entity types, jurisdictions of organization, and principal places of business for all parties.",
-                    sub_checks=[
-                        "buyer_legal_name",
-                        "seller_legal_name",
-                        "entity_type",
-                        "jurisdiction_of_organization",
-                        "principal_place_of_business"
-                    ]
-                ),
-                
-                "transaction_structure": DetectionPattern(
-                    name="Transaction Structure",
-                    description="The transaction structure (stock purchase, asset purchase, merger, etc.) must be clearly defined.",
-                    severity=Severity.CRITICAL,
-                    category=Category.STRUCTURAL_ISSUE,
-                    presence_patterns=[
-                        r"(?i)(purchase.*(?:all|100\s*%|one\s+hundred\s+percent).*(?:stock|shares|equity|membership\s+interests))",
-                        r"(?i)(acquire.*assets)",
-                        r"(?i)(merger|merg(?:e|ing)\s+with)",
-                        r"(?i)(stock\s+purchase|share\s+purchase|equity\s+purchase)",
-                        r"(?i)(asset\s+purchase|asset\s+acquisition)",
-                        r"(?i)(reverse\s+triangular\s+merger|forward\s+merger)",
-                    ],
-                    absence_is_flag=True,
-                    base_risk_score=9,
-                    recommendation="Clearly specify whether this is a stock/equity purchase, asset purchase, forward merger, reverse triangular merger, or other structure.",
-                    related_provisions=["tax_treatment", "liability_assumption"]
-                ),
-                
-                "recitals_background": DetectionPattern(
-                    name="Recitals/Background Section",
-                    description="Agreement should include recitals explaining the context and purpose of the transaction.",
-                    severity=Severity.LOW,
-                    category=Category.STRUCTURAL_ISSUE,
-                    presence_patterns=[
-                        r"(?i)(recitals|whereas|background)",
-                        r"(?i)(the\s+parties\s+desire|the\s+parties\s+wish)",
-                    ],
-                    absence_is_flag=True,
-                    recommended_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=3,
-                    recommendation="Include recitals section to provide context, which aids in contract interpretation.",
-                ),
-                
-                "effective_date": DetectionPattern(
-                    name="Effective Date",
-                    description="Document must specify when it becomes effective.",
-                    severity=Severity.HIGH,
-                    category=Category.STRUCTURAL_ISSUE,
-                    presence_patterns=[
-                        r"(?i)(effective\s+(as\s+of|date))",
-                        r"(?i)(dated\s+(as\s+of)?)",
-                        r"(?i)(this\s+agreement.*made.*as\s+of)",
-                        r"(?i)(entered\s+into\s+(as\s+of|on))",
-                    ],
-                    absence_is_flag=True,
-                    base_risk_score=7,
-                    recommendation="Specify the effective date clearly, either as a specific date or tied to execution.",
-                ),
-                
-                "definitions_section": DetectionPattern(
-                    name="Definitions Section",
-                    description="Complex agreements should have a comprehensive definitions section.",
-                    severity=Severity.MEDIUM,
-                    category=Category.STRUCTURAL_ISSUE,
-                    presence_patterns=[
-                        r"(?i)(definitions|defined\s+terms)",
-                        r"(?i)(\"[A-Z][^\"]+\"\s+(means|shall\s+mean|has\s+the\s+meaning))",
-                        r"(?i)(as\s+defined\s+(herein|below|in\s+section))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    recommended_in=[DocumentType.LOI, DocumentType.TERM_SHEET],
-                    base_risk_score=6,
-                    recommendation="Include comprehensive definitions section for all capitalized terms.",
-                ),
-            },
-            
-            # =================================================================
-            # SECTION 2: PURCHASE PRICE & CONSIDERATION
-            # =================================================================
-            "purchase_price": {
-                
-                "purchase_price_amount": DetectionPattern(
-                    name="Purchase Price Specification",
-                    description="The purchase price must be clearly specified or the formula for determining it must be defined.",
-                    severity=Severity.CRITICAL,
-                    category=Category.FINANCIAL_RISK,
-                    presence_patterns=[
-                        r"(?i)(purchase\s+price.*\$[\d,]+)",
-                        r"(?i)(consideration.*\$[\d,]+)",
-                        r"(?i)(aggregate.*(?:purchase\s+price|consideration))",
-                        r"(?i)(\$[\d,]+.*(?:million|billion|thousand))",
-                        r"(?i)([\d.]+x\s+(?:ebitda|revenue|earnings))",  # Multiple-based pricing
-                    ],
-                    vague_patterns=[
-                        r"(?i)(to\s+be\s+determined|tbd)",
-                        r"(?i)(subject\s+to\s+(?:further\s+)?(?:discussion|negotiation|agreement))",
-                        r"(?i)(industry\s+standard)",
-                        r"(?i)(fair\s+market\s+value)",
-                        r"(?i)(mutually\s+agree[d]?)",
-                    ],
-                    absence_is_flag=True,
-                    base_risk_score=9,
-                    recommendation="Specify exact purchase price or detailed formula. If using multiples, specify the exact multiple and define the metric (e.g., '5.0x TTM Adjusted EBITDA').",
-                    sub_checks=[
-                        "price_formula_clarity",
-                        "reference_metric_definition",
-                        "calculation_methodology"
-                    ]
-                ),
-                
-                "form_of_consideration": DetectionPattern(
-                    name="Form of Consideration",
-                    description="Must specify whether consideration is cash, stock, notes, or combination.",
-                    severity=Severity.HIGH,
-                    category=Category.FINANCIAL_RISK,
-                    presence_patterns=[
-                        r"(?i)(cash\s+consideration|paid\s+in\s+cash|cash\s+payment)",
-                        r"(?i)(stock\s+consideration|shares\s+of\s+(?:common|preferred))",
-                        r"(?i)(promissory\s+note|seller\s+note|deferred\s+payment)",
-                        r"(?i)(combination\s+of\s+cash\s+and)",
-                        r"(?i)(rollover\s+equity)",
-                    ],
-                    absence_is_flag=True,
-                    base_risk_score=8,
-                    recommendation="Clearly specify the form of consideration and breakdown if mixed.",
-                    related_provisions=["stock_valuation", "note_terms"]
-                ),
-                
-                "working_capital_adjustment": DetectionPattern(
-                    name="Working Capital Adjustment",
-                    description="Most M&A deals include working capital adjustments to the purchase price.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(working\s+capital\s+(?:adjustment|target|peg|true-?up))",
-                        r"(?i)(net\s+working\s+capital)",
-                        r"(?i)(current\s+assets.*current\s+liabilities)",
-                        r"(?i)(nwc\s+target)",
-                        r"(?i)(closing\s+(?:date\s+)?working\s+capital)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    recommended_in=[DocumentType.LOI, DocumentType.TERM_SHEET],
-                    base_risk_score=7,
-                    recommendation="Include working capital adjustment mechanism with clearly defined target, calculation methodology, collar/threshold, and dispute resolution process.",
-                    sub_checks=[
-                        "nwc_target_amount",
-                        "nwc_calculation_methodology",
-                        "nwc_collar_threshold",
-                        "nwc_dispute_resolution",
-                        "nwc_true_up_timing"
-                    ]
-                ),
-                
-                "net_debt_adjustment": DetectionPattern(
-                    name="Net Debt Adjustment",
-                    description="Purchase price should be adjusted for debt and cash at closing.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(net\s+debt|debt-?free|cash-?free)",
-                        r"(?i)(indebtedness.*(?:adjustment|deducted|reduced))",
-                        r"(?i)(closing\s+(?:date\s+)?(?:debt|indebtedness|cash))",
-                        r"(?i)(enterprise\s+value.*equity\s+value)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Define net debt clearly (what obligations are included) and specify adjustment mechanism.",
-                    sub_checks=[
-                        "debt_definition",
-                        "debt_like_items",
-                        "cash_definition",
-                        "trapped_cash_treatment"
-                    ]
-                ),
-                
-                "transaction_expenses_adjustment": DetectionPattern(
-                    name="Transaction Expenses Adjustment",
-                    description="Specify treatment of seller's transaction expenses (legal, accounting, investment banking fees).",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(transaction\s+expenses?|seller.*expenses?|company.*expenses?)",
-                        r"(?i)(unpaid.*(?:fees|expenses).*closing)",
-                        r"(?i)(advisor[y]?\s+fees|investment\s+bank(?:ing|er)\s+fees)",
-                    ],
-                    absence_is_flag=True,
-                    base_risk_score=6,
-                    recommendation="Specify whether seller transaction expenses are deducted from purchase price or paid separately, with clear definition of included expenses.",
-                ),
-                
-                "earnout_provisions": DetectionPattern(
-                    name="Earnout Provisions",
-                    description="If purchase price includes earnouts, detailed terms must be specified.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(earn-?out|contingent\s+(?:consideration|payment)|performance\s+(?:payment|bonus))",
-                        r"(?i)(additional\s+consideration.*(?:based\s+on|contingent|if))",
-                        r"(?i)(milestone\s+payment)",
-                    ],
-                    # Not absence_is_flag because earnouts aren't always present
-                    problematic_patterns=[
-                        r"(?i)(sole\s+discretion)",  # Too much discretion for buyer
-                        r"(?i)(reasonable\s+efforts)",  # Vague effort standard
-                    ],
-                    base_risk_score=8,
-                    recommendation="If earnouts present, specify: metrics (revenue, EBITDA, etc.), measurement periods, targets, calculation methodology, acceleration triggers, dispute resolution, and buyer's operational covenants.",
-                    sub_checks=[
-                        "earnout_metric_definition",
-                        "earnout_measurement_period",
-                        "earnout_targets",
-                        "earnout_calculation",
-                        "earnout_acceleration",
-                        "earnout_dispute_mechanism",
-                        "earnout_operational_covenants",
-                        "earnout_accounting_principles"
-                    ]
-                ),
-                
-                "escrow_holdback": DetectionPattern(
-                    name="Escrow/Holdback Provisions",
-                    description="Standard M&A deals include escrow or holdback for indemnification claims.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(escrow|holdback|hold-?back|retained\s+amount)",
-                        r"(?i)(escrow\s+agent|escrow\s+agreement)",
-                        r"(?i)(indemnification\s+escrow|indemnity\s+escrow)",
-                        r"(?i)((?:\d+|ten|fifteen|twenty)\s*%.*(?:escrow|holdback))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    recommended_in=[DocumentType.LOI, DocumentType.TERM_SHEET],
-                    base_risk_score=7,
-                    recommendation="Include escrow/holdback provisions (typically 10-15% of purchase price) with clear terms on amount, duration, release conditions, and escrow agent.",
-                    sub_checks=[
-                        "escrow_amount",
-                        "escrow_duration",
-                        "escrow_release_conditions",
-                        "escrow_agent_identity",
-                        "escrow_disputes"
-                    ]
-                ),
-                
-                "purchase_price_allocation": DetectionPattern(
-                    name="Purchase Price Allocation",
-                    description="For asset deals and stock deals with 338(h)(10) elections, purchase price allocation is critical for tax purposes.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(purchase\s+price\s+allocation|allocation.*purchase\s+price)",
-                        r"(?i)(section\s+1060|irs\s+form\s+8594)",
-                        r"(?i)(338\s*\(?h?\)?\s*\(?\s*10\)?)",
-                        r"(?i)(allocat(?:e|ion).*(?:assets|goodwill|intangible))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.ASSET_PURCHASE],
-                    recommended_in=[DocumentType.STOCK_PURCHASE],
-                    base_risk_score=6,
-                    recommendation="Include purchase price allocation methodology, timeline for agreement, and dispute resolution. Reference IRS Form 8594/Section 1060 for asset deals.",
-                ),
-                
-                "stock_consideration_terms": DetectionPattern(
-                    name="Stock Consideration Terms",
-                    description="If consideration includes stock, detailed terms must be specified.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(stock\s+consideration|share\s+consideration|equity\s+consideration)",
-                        r"(?i)(shares\s+of\s+(?:common|preferred)\s+stock)",
-                        r"(?i)(exchange\s+ratio)",
-                        r"(?i)(fixed\s+(?:value|number)\s+of\s+shares)",
-                    ],
-                    base_risk_score=8,
-                    recommendation="Specify: number of shares or exchange ratio, valuation mechanism, registration rights, lock-up periods, price protection/collars, and treatment of fractional shares.",
-                    sub_checks=[
-                        "share_count_or_ratio",
-                        "stock_valuation_methodology",
-                        "registration_rights",
-                        "lock_up_provisions",
-                        "price_collars",
-                        "fractional_share_treatment"
-                    ]
-                ),
-                
-                "seller_note_terms": DetectionPattern(
-                    name="Seller Note Terms",
-                    description="If consideration includes seller financing, note terms must be specified.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(seller\s+note|promissory\s+note|seller\s+financ)",
-                        r"(?i)(deferred\s+(?:purchase\s+price|payment|consideration))",
-                        r"(?i)(subordinated\s+(?:note|debt))",
-                    ],
-                    base_risk_score=8,
-                    recommendation="Specify: principal amount, interest rate, payment schedule, maturity, security/subordination, prepayment rights, default provisions, and acceleration triggers.",
-                    sub_checks=[
-                        "note_principal",
-                        "note_interest_rate",
-                        "note_payment_schedule",
-                        "note_maturity",
-                        "note_security",
-                        "note_subordination",
-                        "note_prepayment",
-                        "note_default_triggers"
-                    ]
-                ),
-            },
-            
-            # =================================================================
-            # SECTION 3: DUE DILIGENCE
-            # =================================================================
-            "due_diligence": {
-                
-                "due_diligence_scope": DetectionPattern(
-                    name="Due Diligence Scope",
-                    description="The scope and categories of due diligence must be comprehensive.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(due\s+diligence|diligence\s+review|diligence\s+investigation)",
-                        r"(?i)(access\s+to.*(?:books|records|documents|information))",
-                        r"(?i)(diligence\s+(?:materials?|documents?|items?))",
-                    ],
-                    vague_patterns=[
-                        r"(?i)(reasonable\s+access)",
-                        r"(?i)(customary\s+due\s+diligence)",
-                        r"(?i)(standard\s+diligence)",
-                    ],
-                    absence_is_flag=True,
-                    base_risk_score=8,
-                    recommendation="Specify comprehensive due diligence scope covering: financials, tax, legal, IP, environmental, HR, IT, commercial, regulatory, insurance, and real estate.",
-                    sub_checks=[
-                        "dd_financial",
-                        "dd_tax",
-                        "dd_legal",
-                        "dd_ip",
-                        "dd_environmental",
-                        "dd_hr_employment",
-                        "dd_it_systems",
-                        "dd_commercial",
-                        "dd_regulatory",
-                        "dd_insurance",
-                        "dd_real_estate"
-                    ]
-                ),
-                
-                "due_diligence_period": DetectionPattern(
-                    name="Due Diligence Period",
-                    description="A specific time period for due diligence should be defined.",
-                    severity=Severity.HIGH,
-                    category=Category.TIMELINE_ISSUE,
-                    presence_patterns=[
-                        r"(?i)(due\s+diligence\s+period)",
-                        r"(?i)(diligence.*(?:days?|weeks?|period|until))",
-                        r"(?i)((\d+)\s*(?:calendar|business|working)?\s*days?.*(?:diligence|investigation))",
-                        r"(?i)(access.*through|access.*until)",
-                    ],
-                    absence_is_flag=True,
-                    base_risk_score=7,
-                    recommendation="Specify due diligence period with clear start date, end date, and any extension mechanisms.",
-                ),
-                
-                "financial_statements_access": DetectionPattern(
-                    name="Financial Statements Access",
-                    description="Access to financial statements and records.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(financial\s+statements?|audited\s+financials?|unaudited\s+financials?)",
-                        r"(?i)(balance\s+sheets?|income\s+statements?|cash\s+flow)",
-                        r"(?i)(management\s+accounts|monthly\s+financials?)",
-                        r"(?i)((?:three|3|five|5)\s+years?.*financials?)",
-                    ],
-                    vague_patterns=[
-                        r"(?i)(relevant\s+financial|appropriate\s+financial)",
-                    ],
-                    absence_is_flag=True,
-                    base_risk_score=7,
-                    recommendation="Specify: years of audited/unaudited financials, interim statements, management accounts, and format requirements.",
-                    sub_checks=[
-                        "audited_financial_years",
-                        "unaudited_interim_statements",
-                        "management_accounts",
-                        "budget_projections",
-                        "audit_workpapers"
-                    ]
-                ),
-                
-                "facility_access": DetectionPattern(
-                    name="Facility Access",
-                    description="Access to physical facilities and operations.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(facilit(?:y|ies)\s+(?:access|visit|inspection|tour))",
-                        r"(?i)(site\s+visits?|on-?site\s+(?:access|inspection))",
-                        r"(?i)(physical\s+inspection)",
-                        r"(?i)(access\s+to.*(?:premises|locations?|offices?|plants?))",
-                    ],
-                    absence_is_flag=True,
-                    recommended_in=[DocumentType.LOI, DocumentType.TERM_SHEET],
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE],
-                    base_risk_score=5,
-                    recommendation="Include right to visit and inspect all material facilities, with reasonable notice requirements.",
-                ),
-                
-                "personnel_access": DetectionPattern(
-                    name="Management/Personnel Access",
-                    description="Access to interview key personnel and management.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(access\s+to.*(?:management|personnel|employees|officers|key\s+people))",
-                        r"(?i)(interview.*(?:management|employees|personnel))",
-                        r"(?i)(management\s+(?:meetings?|presentations?|discussions?))",
-                    ],
-                    absence_is_flag=True,
-                    base_risk_score=5,
-                    recommendation="Include right to interview management and key employees, subject to reasonable coordination with seller.",
-                ),
-                
-                "customer_vendor_access": DetectionPattern(
-                    name="Customer/Vendor Access",
-                    description="Access to contact customers, vendors, and business partners.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)((?:customer|vendor|supplier|client)\s+(?:access|contacts?|references?|calls?|meetings?))",
-                        r"(?i)(contact.*(?:customers?|vendors?|suppliers?|clients?))",
-                        r"(?i)(customer\s+diligence|commercial\s+diligence)",
-                    ],
-                    base_risk_score=5,
-                    recommendation="Specify whether buyer can contact customers/vendors directly or only through seller-arranged calls, and any consent requirements.",
-                ),
-                
-                "data_room_access": DetectionPattern(
-                    name="Data Room Access",
-                    description="Access to virtual or physical data room.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(data\s+room|virtual\s+data\s+room|vdr)",
-                        r"(?i)(document\s+repository)",
-                        r"(?i)(diligence\s+portal)",
-                    ],
-                    absence_is_flag=True,
-                    recommended_in=[DocumentType.LOI, DocumentType.TERM_SHEET],
-                    base_risk_score=4,
-                    recommendation="Specify data room access terms, including timing, user permissions, and document production timeline.",
-                ),
-                
-                "quality_of_earnings": DetectionPattern(
-                    name="Quality of Earnings Report",
-                    description="Right to conduct or receive quality of earnings analysis.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(quality\s+of\s+earnings|q\s*of\s*e|qoe)",
-                        r"(?i)(earnings\s+(?:quality|analysis|report))",
-                        r"(?i)(financial\s+diligence\s+report)",
-                    ],
-                    absence_is_flag=True,
-                    recommended_in=[DocumentType.LOI, DocumentType.TERM_SHEET],
-                    base_risk_score=4,
-                    recommendation="Include right to conduct quality of earnings analysis with access to underlying data and personnel.",
-                ),
-                
-                "environmental_diligence": DetectionPattern(
-                    name="Environmental Due Diligence",
-                    description="Environmental assessments and Phase I/II reports.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(environmental\s+(?:diligence|assessment|review|audit|report))",
-                        r"(?i)(phase\s+(?:i|1|ii|2)\s+(?:environmental|assessment|report))",
-                        r"(?i)(environmental\s+site\s+assessment|esa)",
-                        r"(?i)(hazardous\s+(?:materials?|substances?|waste))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE],
-                    base_risk_score=5,
-                    recommendation="Include right to conduct Phase I (and if needed Phase II) environmental assessments.",
-                ),
-                
-                "it_systems_diligence": DetectionPattern(
-                    name="IT/Systems Due Diligence",
-                    description="Review of IT systems, cybersecurity, and data practices.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(it\s+(?:diligence|systems?|infrastructure|review))",
-                        r"(?i)(cybersecurity|cyber\s+security|information\s+security)",
-                        r"(?i)(technology\s+(?:systems?|infrastructure|review|assessment))",
-                        r"(?i)(data\s+(?:privacy|protection|security))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE],
-                    base_risk_score=5,
-                    recommendation="Include IT systems review covering infrastructure, security, data privacy compliance, and technical debt.",
-                ),
-            },
-            
-            # =================================================================
-            # SECTION 4: REPRESENTATIONS & WARRANTIES
-            # =================================================================
-            "representations_warranties": {
-                
-                "reps_warranties_general": DetectionPattern(
-                    name="Representations and Warranties Section",
-                    description="Definitive agreements must contain comprehensive representations and warranties.",
-                    severity=Severity.CRITICAL,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(representations?\s+and\s+warranties?)",
-                        r"(?i)((?:seller|company|target)\s+represents?\s+and\s+warrants?)",
-                        r"(?i)((?:buyer|purchaser)\s+represents?\s+and\s+warrants?)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=10,
-                    recommendation="Include comprehensive representations and warranties covering all material aspects of the target business.",
-                ),
-                
-                "organization_authority_rep": DetectionPattern(
-                    name="Organization and Authority Representation",
-                    description="Representation that parties are validly organized and authorized to enter the transaction.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(duly\s+(?:organized|incorporated|formed))",
-                        r"(?i)(validly\s+existing)",
-                        r"(?i)(good\s+standing)",
-                        r"(?i)((?:corporate|company)\s+(?:power|authority))",
-                        r"(?i)(duly\s+authorized)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=8,
-                    recommendation="Include standard organization, valid existence, good standing, and authority representations.",
-                ),
-                
-                "capitalization_rep": DetectionPattern(
-                    name="Capitalization Representation",
-                    description="Representation regarding equity ownership, outstanding securities, and capital structure.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(capitalization)",
-                        r"(?i)(authorized.*(?:shares?|stock|capital))",
-                        r"(?i)(issued\s+and\s+outstanding)",
-                        r"(?i)(no\s+(?:other|additional)\s+(?:equity|shares?|securities))",
-                        r"(?i)((?:options?|warrants?|convertible).*(?:outstanding|issued))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=8,
-                    recommendation="Include detailed capitalization representation covering all classes of equity, options, warrants, and convertible securities.",
-                ),
-                
-                "financial_statements_rep": DetectionPattern(
-                    name="Financial Statements Representation",
-                    description="Representation that financial statements are accurate and prepared in accordance with GAAP.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(financial\s+statements?\s+(?:are|have\s+been|were).*(?:prepared|accurate|true|correct))",
-                        r"(?i)(gaap|generally\s+accepted\s+accounting\s+principles)",
-                        r"(?i)(fairly\s+present.*(?:financial|results|condition))",
-                        r"(?i)(present\s+fairly.*(?:financial\s+position|results\s+of\s+operations))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=8,
-                    recommendation="Include representation that financial statements are GAAP compliant and fairly present the company's financial condition.",
-                ),
-                
-                "no_undisclosed_liabilities_rep": DetectionPattern(
-                    name="No Undisclosed Liabilities Representation",
-                    description="Representation that there are no material undisclosed liabilities.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(no\s+(?:undisclosed|other|additional|material)\s+liabilit(?:y|ies))",
-                        r"(?i)(liabilities.*(?:other\s+than|except).*(?:financial\s+statements|disclosed))",
-                        r"(?i)(absence\s+of.*liabilities)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=8,
-                    recommendation="Include representation regarding absence of undisclosed liabilities, with appropriate carve-outs for liabilities in the ordinary course.",
-                ),
-                
-                "litigation_rep": DetectionPattern(
-                    name="Litigation Representation",
-                    description="Representation regarding pending or threatened litigation.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(litigation|legal\s+proceedings?|lawsuits?|claims?)",
-                        r"(?i)(pending\s+or\s+threatened)",
-                        r"(?i)(no\s+(?:material\s+)?(?:litigation|proceedings?|actions?|suits?))",
-                        r"(?i)((?:legal|judicial|administrative)\s+(?:actions?|proceedings?))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include representation covering pending and threatened litigation, claims, investigations, and proceedings.",
-                ),
-                
-                "compliance_with_laws_rep": DetectionPattern(
-                    name="Compliance with Laws Representation",
-                    description="Representation regarding compliance with applicable laws and regulations.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(compliance\s+with\s+(?:applicable\s+)?laws?)",
-                        r"(?i)((?:in\s+)?compliance\s+(?:in\s+all\s+material\s+respects\s+)?with.*(?:laws?|regulations?|statutes?))",
-                        r"(?i)(legal\s+compliance)",
-                        r"(?i)((?:not\s+in\s+)?violation\s+of\s+(?:any\s+)?(?:laws?|regulations?))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include representation regarding compliance with all applicable laws, regulations, and governmental orders.",
-                ),
-                
-                "material_contracts_rep": DetectionPattern(
-                    name="Material Contracts Representation",
-                    description="Representation regarding material contracts and their status.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(material\s+contracts?)",
-                        r"(?i)(contracts?.*(?:schedule|exhibit|disclosure))",
-                        r"(?i)(no\s+(?:breach|default|violation).*(?:contracts?|agreements?))",
-                        r"(?i)((?:in\s+)?full\s+force\s+and\s+effect)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include representation listing all material contracts with representation that they are valid, binding, and not in breach.",
-                ),
-                
-                "intellectual_property_rep": DetectionPattern(
-                    name="Intellectual Property Representation",
-                    description="Representation regarding ownership and protection of intellectual property.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(intellectual\s+property|ip\s+(?:rights?|assets?))",
-                        r"(?i)(patents?|trademarks?|copyrights?|trade\s+secrets?)",
-                        r"(?i)(proprietary\s+(?:rights?|technology|information))",
-                        r"(?i)((?:owns?|ownership|title).*(?:ip|intellectual\s+property))",
-                        r"(?i)(no\s+(?:infringement|misappropriation))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include comprehensive IP representation covering ownership, registrations, licenses, infringement, and employee/contractor IP assignments.",
-                    sub_checks=[
-                        "ip_ownership",
-                        "ip_registrations",
-                        "ip_licenses_in",
-                        "ip_licenses_out",
-                        "ip_infringement",
-                        "ip_assignments"
-                    ]
-                ),
-                
-                "employee_matters_rep": DetectionPattern(
-                    name="Employee Matters Representation",
-                    description="Representation regarding employees, employment agreements, and labor matters.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(employee\s+(?:matters?|relations?|list|census))",
-                        r"(?i)(employment\s+(?:agreements?|contracts?))",
-                        r"(?i)(labor\s+(?:matters?|relations?|disputes?|unions?))",
-                        r"(?i)((?:compensation|salary|benefits?|bonus).*(?:employees?|personnel))",
-                        r"(?i)(collective\s+bargaining)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include representation covering employee census, compensation, benefits, agreements, labor relations, and compliance with employment laws.",
-                ),
-                
-                "employee_benefits_rep": DetectionPattern(
-                    name="Employee Benefits/ERISA Representation",
-                    description="Representation regarding employee benefit plans and ERISA compliance.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(employee\s+benefit\s+plans?|benefit\s+plans?)",
-                        r"(?i)(erisa|pension|retirement\s+plan)",
-                        r"(?i)(401\s*\(?k\)?|defined\s+benefit|defined\s+contribution)",
-                        r"(?i)(health\s+(?:insurance|plan|benefits?))",
-                        r"(?i)(multiemployer\s+plan)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include comprehensive ERISA representation covering all benefit plans, qualified status, funding, prohibited transactions, and multiemployer plan liability.",
-                ),
-                
-                "tax_rep": DetectionPattern(
-                    name="Tax Representation",
-                    description="Representation regarding tax matters, filings, and liabilities.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(tax\s+(?:matters?|returns?|liabilit(?:y|ies)|filings?))",
-                        r"(?i)(filed\s+(?:all\s+)?(?:required\s+)?tax\s+returns?)",
-                        r"(?i)((?:paid|payment\s+of)\s+(?:all\s+)?taxes)",
-                        r"(?i)(no\s+(?:tax\s+)?(?:audits?|examinations?|assessments?))",
-                        r"(?i)(tax\s+(?:deficienc(?:y|ies)|claims?))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include comprehensive tax representation covering filings, payments, audits, reserves, transfer pricing, and net operating losses.",
-                ),
-                
-                "environmental_rep": DetectionPattern(
-                    name="Environmental Representation",
-                    description="Representation regarding environmental compliance and liabilities.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(environmental\s+(?:matters?|compliance|laws?|liabilit(?:y|ies)|permits?))",
-                        r"(?i)(hazardous\s+(?:substances?|materials?|waste))",
-                        r"(?i)(environmental\s+(?:contamination|remediation|cleanup))",
-                        r"(?i)(cercla|superfund|rcra)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include environmental representation covering compliance, permits, contamination, remediation obligations, and environmental liabilities.",
-                ),
-                
-                "insurance_rep": DetectionPattern(
-                    name="Insurance Representation",
-                    description="Representation regarding insurance coverage.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(insurance\s+(?:polic(?:y|ies)|coverage|matters?))",
-                        r"(?i)((?:adequate|sufficient)\s+insurance)",
-                        r"(?i)(insured\s+(?:against|for))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=5,
-                    recommendation="Include representation regarding adequacy of insurance coverage, claims history, and policy status.",
-                ),
-                
-                "real_property_rep": DetectionPattern(
-                    name="Real Property Representation",
-                    description="Representation regarding owned and leased real property.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(real\s+property|real\s+estate)",
-                        r"(?i)(owned\s+(?:real\s+)?propert(?:y|ies))",
-                        r"(?i)(leased\s+(?:real\s+)?propert(?:y|ies)|lease(?:d|s)\s+premises)",
-                        r"(?i)((?:title|ownership)\s+to\s+(?:real\s+)?property)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=5,
-                    recommendation="Include representation covering owned real property (title, liens, encumbrances) and leased property (lease terms, compliance, landlord consents).",
-                ),
-                
-                "related_party_transactions_rep": DetectionPattern(
-                    name="Related Party Transactions Representation",
-                    description="Representation regarding transactions with related parties.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(related\s+party\s+(?:transactions?|agreements?|arrangements?))",
-                        r"(?i)(affiliate\s+(?:transactions?|agreements?|contracts?))",
-                        r"(?i)((?:transactions?|dealings?)\s+with\s+(?:affiliates?|related\s+parties?))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=6,
-                    recommendation="Include representation disclosing all related party transactions and agreements that will continue post-closing.",
-                ),
-                
-                "brokers_rep": DetectionPattern(
-                    name="Brokers/Finders Fee Representation",
-                    description="Representation regarding broker and finder fees.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(brokers?|finders?|investment\s+bank(?:ers?)?)",
-                        r"(?i)((?:broker(?:age)?|finder(?:\'?s)?)\s+fees?)",
-                        r"(?i)(no\s+(?:other\s+)?(?:broker|finder|agent))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=5,
-                    recommendation="Include representation that no broker or finder fees are owed except as disclosed, with indemnification for any undisclosed fees.",
-                ),
-                
-                "data_privacy_rep": DetectionPattern(
-                    name="Data Privacy/Cybersecurity Representation",
-                    description="Representation regarding data privacy and cybersecurity.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(data\s+(?:privacy|protection|security))",
-                        r"(?i)(privacy\s+(?:laws?|policies?|compliance))",
-                        r"(?i)(gdpr|ccpa|hipaa|pci)",
-                        r"(?i)(personal\s+(?:data|information)|pii)",
-                        r"(?i)(cybersecurity|cyber\s+security|data\s+breach)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include representation covering data privacy compliance (GDPR, CCPA, HIPAA as applicable), privacy policies, data security measures, and breach history.",
-                ),
-                
-                "anti_corruption_rep": DetectionPattern(
-                    name="Anti-Corruption/FCPA Representation",
-                    description="Representation regarding anti-bribery and anti-corruption compliance.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(anti-?corruption|anti-?bribery)",
-                        r"(?i)(fcpa|foreign\s+corrupt\s+practices\s+act)",
-                        r"(?i)(uk\s+bribery\s+act)",
-                        r"(?i)(corrupt\s+(?:payments?|practices?))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include representation regarding FCPA and anti-corruption compliance, especially for targets with international operations.",
-                ),
-                
-                "sanctions_export_rep": DetectionPattern(
-                    name="Sanctions/Export Control Representation",
-                    description="Representation regarding sanctions and export control compliance.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(sanctions?|ofac|sdn\s+list)",
-                        r"(?i)(export\s+control|ear|itar)",
-                        r"(?i)((?:trade|economic)\s+sanctions?)",
-                        r"(?i)((?:restricted|denied)\s+part(?:y|ies))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include representation regarding OFAC sanctions compliance and export control compliance (EAR, ITAR as applicable).",
-                ),
-                
-                "no_other_reps_warranty": DetectionPattern(
-                    name="No Other Representations Clause",
-                    description="Clause disclaiming representations other than those expressly made.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(no\s+other\s+representations?)",
-                        r"(?i)((?:except\s+(?:for|as)).*(?:expressly|specifically)\s+(?:set\s+forth|made|stated))",
-                        r"(?i)(disclaim(?:s|ing)?\s+(?:all\s+)?(?:other\s+)?(?:representations?|warranties?))",
-                        r"(?i)(as-?is)",
-                    ],
-                    base_risk_score=5,
-                    recommendation="Consider adding disclaimer of extra-contractual representations to limit liability exposure.",
-                ),
-                
-                "knowledge_qualifiers": DetectionPattern(
-                    name="Knowledge Qualifiers Definition",
-                    description="Definition of 'knowledge' for purposes of qualified representations.",
-                    severity=Severity.MEDIUM,
-                    category=Category.INCOMPLETE_DEFINITION,
-                    presence_patterns=[
-                        r"(?i)(\"knowledge\"|knowledge\s+of\s+(?:seller|company)|seller(?:\'s|s)?\s+knowledge)",
-                        r"(?i)(to\s+the\s+knowledge\s+of)",
-                        r"(?i)(actual\s+knowledge|constructive\s+knowledge)",
-                        r"(?i)(knowledge.*(?:means|shall\s+mean|defined))",
-                    ],
-                    vague_patterns=[
-                        r"(?i)(best\s+of.*knowledge)",  # Vague knowledge standard
-                    ],
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=6,
-                    recommendation="Define 'knowledge' precisely, including whether it's actual or constructive knowledge, and identify the individuals whose knowledge is attributed to the company.",
-                ),
-                
-                "materiality_qualifiers": DetectionPattern(
-                    name="Materiality/MAE Qualifiers",
-                    description="Use and definition of materiality qualifiers and Material Adverse Effect.",
-                    severity=Severity.HIGH,
-                    category=Category.AMBIGUITY,
-                    presence_patterns=[
-                        r"(?i)(material\s+adverse\s+(?:effect|change|event)|mae|mac)",
-                        r"(?i)(\"material\"|material\s+(?:means|shall\s+mean))",
-                        r"(?i)(in\s+all\s+material\s+respects)",
-                    ],
-                    problematic_patterns=[
-                        r"(?i)(double\s+material)",  # Double materiality scrape
-                    ],
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Define Material Adverse Effect/Change carefully with appropriate carve-outs. Be consistent in application of materiality qualifiers.",
-                ),
-                
-                "disclosure_schedules_reference": DetectionPattern(
-                    name="Disclosure Schedules Reference",
-                    description="Reference to and requirements for disclosure schedules.",
-                    severity=Severity.HIGH,
-                    category=Category.STRUCTURAL_ISSUE,
-                    presence_patterns=[
-                        r"(?i)(disclosure\s+(?:schedules?|letter))",
-                        r"(?i)(schedule\s+\d+\.\d+)",
-                        r"(?i)(set\s+forth\s+(?:on|in)\s+schedule)",
-                        r"(?i)(seller\s+disclosure\s+(?:schedule|letter))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include comprehensive disclosure schedules and specify updating mechanism, cross-reference rules, and standard for disclosure (specific vs. general).",
-                ),
-            },
-            
-            # =================================================================
-            # SECTION 5: COVENANTS
-            # =================================================================
-            "covenants": {
-                
-                "pre_closing_covenants_general": DetectionPattern(
-                    name="Pre-Closing Covenants Section",
-                    description="Covenants governing conduct between signing and closing.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(pre-?closing\s+covenants?|covenants?\s+(?:prior\s+to|pending)\s+closing)",
-                        r"(?i)(between\s+(?:signing|execution|the\s+date\s+hereof)\s+and\s+(?:closing|the\s+closing\s+date))",
-                        r"(?i)(conduct\s+of\s+(?:the\s+)?business)",
-                        r"(?i)(interim\s+(?:period|covenants?|operating\s+covenants?))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=8,
-                    recommendation="Include comprehensive pre-closing covenants governing business operations between signing and closing.",
-                ),
-                
-                "ordinary_course_covenant": DetectionPattern(
-                    name="Ordinary Course of Business Covenant",
-                    description="Covenant to operate business in ordinary course pending closing.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(ordinary\s+course\s+of\s+business)",
-                        r"(?i)(conduct\s+(?:of\s+)?(?:the\s+)?business\s+in\s+the\s+ordinary\s+course)",
-                        r"(?i)(consistent\s+with\s+past\s+practice)",
-                    ],
-                    vague_patterns=[
-                        r"(?i)(ordinary\s+course(?!\s+of\s+business))",  # Missing "of business"
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=8,
-                    recommendation="Define ordinary course precisely and include specific permitted/prohibited actions list.",
-                ),
-                
-                "negative_covenants": DetectionPattern(
-                    name="Negative/Restrictive Covenants",
-                    description="Specific restrictions on seller's conduct pending closing.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(shall\s+not.*without.*(?:prior\s+)?(?:written\s+)?consent)",
-                        r"(?i)((?:seller|company|target)\s+shall\s+not)",
-                        r"(?i)(prohibited\s+(?:actions?|conduct))",
-                        r"(?i)(negative\s+covenants?|restrictive\s+covenants?)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include specific negative covenants covering: equity issuances, dividends, asset sales, debt incurrence, capex, material contracts, employment changes, etc.",
-                    sub_checks=[
-                        "no_equity_issuance",
-                        "no_dividends",
-                        "no_asset_sales",
-                        "no_debt_incurrence",
-                        "capex_restrictions",
-                        "contract_restrictions",
-                        "employment_restrictions",
-                        "accounting_method_restrictions"
-                    ]
-                ),
-                
-                "access_covenant": DetectionPattern(
-                    name="Access Covenant",
-                    description="Ongoing access to information and personnel pending closing.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(access.*(?:pending|prior\s+to)\s+closing)",
-                        r"(?i)(continued\s+access)",
-                        r"(?i)(access\s+to.*(?:books|records|personnel|facilities))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=5,
-                    recommendation="Include covenant for continued access to information, personnel, and facilities pending closing.",
-                ),
-                
-                "notification_covenant": DetectionPattern(
-                    name="Notification/Update Covenant",
-                    description="Obligation to notify of material changes or breaches.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)((?:shall|will)\s+(?:promptly\s+)?(?:notify|inform|advise))",
-                        r"(?i)(notification\s+(?:covenant|obligation))",
-                        r"(?i)(notice\s+of.*(?:material|breach|change))",
-                        r"(?i)(update.*(?:disclosure|schedules?))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=5,
-                    recommendation="Include covenant requiring prompt notification of material developments, rep breaches, and schedule updates.",
-                ),
-                
-                "efforts_to_close_covenant": DetectionPattern(
-                    name="Efforts to Close Covenant",
-                    description="Covenant regarding efforts to satisfy closing conditions and consummate transaction.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)((?:commercially\s+)?reasonable\s+(?:best\s+)?efforts)",
-                        r"(?i)(best\s+efforts)",
-                        r"(?i)(use\s+(?:its|their)\s+(?:commercially\s+)?reasonable\s+efforts)",
-                        r"(?i)(efforts\s+to\s+(?:consummate|close|satisfy))",
-                    ],
-                    vague_patterns=[
-                        r"(?i)(reasonable\s+efforts(?!\s+(?:to|covenant)))",  # Standalone without context
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Specify effort standard (best efforts vs. commercially reasonable efforts) and what it requires.",
-                ),
-                
-                "regulatory_approval_covenant": DetectionPattern(
-                    name="Regulatory Approval Covenant",
-                    description="Covenant regarding obtaining required regulatory approvals.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)((?:regulatory|governmental)\s+(?:approvals?|consents?|filings?))",
-                        r"(?i)(hsr|hart-?scott-?rodino)",
-                        r"(?i)(antitrust\s+(?:approval|clearance|filing))",
-                        r"(?i)(cfius|(?:foreign\s+)?investment\s+review)",
-                        r"(?i)(fcc|fda|(?:sec|securities)\s+(?:approval|filing))",
-                    ],
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include specific covenants for required regulatory filings (HSR, CFIUS, industry-specific) with timing requirements and cooperation obligations.",
-                    sub_checks=[
-                        "hsr_filing_covenant",
-                        "cfius_review",
-                        "industry_regulatory_approvals",
-                        "state_approvals",
-                        "foreign_approvals"
-                    ]
-                ),
-                
-                "hell_or_high_water_covenant": DetectionPattern(
-                    name="Hell or High Water/Divestiture Covenant",
-                    description="Commitment regarding divestitures or remedies for regulatory approval.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(hell\s+or\s+high\s+water)",
-                        r"(?i)(divest(?:iture)?|hold\s+separate|behavioral\s+remed(?:y|ies))",
-                        r"(?i)(antitrust\s+(?:remed(?:y|ies)|commitment))",
-                    ],
-                    required_in=[DocumentType.MERGER_AGREEMENT],  # Primarily large public deals
-                    base_risk_score=6,
-                    recommendation="For deals requiring antitrust approval, specify whether buyer must accept divestitures or behavioral remedies (hell or high water) or if there are limits.",
-                ),
-                
-                "third_party_consents_covenant": DetectionPattern(
-                    name="Third Party Consents Covenant",
-                    description="Covenant to obtain required third party consents.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(third\s+party\s+consents?)",
-                        r"(?i)(consents?\s+(?:required|necessary|needed))",
-                        r"(?i)(change\s+of\s+control\s+consents?)",
-                        r"(?i)(landlord\s+consents?|customer\s+consents?|vendor\s+consents?)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=5,
-                    recommendation="Include covenant to use efforts to obtain required third party consents, with list of material consents required as closing condition.",
-                ),
-                
-                "exclusivity_noshop": DetectionPattern(
-                    name="Exclusivity/No-Shop Provision",
-                    description="Restriction on seller's ability to solicit or engage with other potential buyers.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(exclusivity|exclusive\s+(?:dealing|negotiation|right))",
-                        r"(?i)(no-?shop|no\s+shop)",
-                        r"(?i)(no-?solicitation|no\s+solicitation)",
-                        r"(?i)(shall\s+not.*(?:solicit|encourage|initiate|negotiate).*(?:other|alternative|competing))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.LOI, DocumentType.TERM_SHEET],
-                    recommended_in=[DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include no-shop provision with clear scope, duration, and any fiduciary out carve-outs.",
-                    sub_checks=[
-                        "exclusivity_duration",
-                        "exclusivity_scope",
-                        "fiduciary_out",
-                        "matching_rights",
-                        "window_shop"
-                    ]
-                ),
-                
-                "fiduciary_out": DetectionPattern(
-                    name="Fiduciary Out",
-                    description="Carve-out allowing seller to respond to unsolicited superior proposals.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(fiduciary\s+(?:out|exception|duties?))",
-                        r"(?i)(superior\s+proposal)",
-                        r"(?i)(intervening\s+event)",
-                        r"(?i)(board.*fiduciary\s+(?:duties?|obligations?))",
-                    ],
-                    recommended_in=[DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=5,
-                    recommendation="For public company deals, consider fiduciary out provisions allowing board to respond to unsolicited superior proposals.",
-                ),
-                
-                "employee_retention_covenant": DetectionPattern(
-                    name="Employee Retention Covenant",
-                    description="Covenants regarding treatment and retention of employees.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(employee\s+(?:retention|matters?|continuation|treatment))",
-                        r"(?i)(retain(?:ing)?\s+(?:key\s+)?employees?)",
-                        r"(?i)(employment\s+(?:offers?|continuation))",
-                        r"(?i)((?:key|critical)\s+employees?)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=5,
-                    recommendation="Include provisions regarding employee treatment, retention bonuses, and employment offers.",
-                ),
-                
-                "non_compete_covenant": DetectionPattern(
-                    name="Non-Competition Covenant",
-                    description="Post-closing non-compete restrictions on seller/principals.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(non-?competition?|(?:shall|will)\s+not\s+compete)",
-                        r"(?i)(restrictive\s+covenant)",
-                        r"(?i)(covenant\s+not\s+to\s+compete)",
-                        r"(?i)(competitive\s+(?:business|activit(?:y|ies)))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include non-compete with clear scope (geographic, business lines), duration, and covered persons.",
-                    sub_checks=[
-                        "noncompete_duration",
-                        "noncompete_geographic_scope",
-                        "noncompete_business_scope",
-                        "noncompete_covered_persons"
-                    ]
-                ),
-                
-                "non_solicit_covenant": DetectionPattern(
-                    name="Non-Solicitation Covenant",
-                    description="Post-closing restrictions on soliciting employees or customers.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(non-?solicitation?|(?:shall|will)\s+not\s+solicit)",
-                        r"(?i)((?:not|refrain\s+from)\s+solicit(?:ing)?.*(?:employees?|customers?))",
-                        r"(?i)((?:employee|customer)\s+non-?solicitation?)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=6,
-                    recommendation="Include non-solicitation of employees and customers with clear scope and duration.",
-                    sub_checks=[
-                        "employee_nonsolicit_duration",
-                        "customer_nonsolicit_duration",
-                        "covered_employees",
-                        "covered_customers"
-                    ]
-                ),
-                
-                "confidentiality_covenant": DetectionPattern(
-                    name="Confidentiality Covenant",
-                    description="Confidentiality obligations regarding transaction and business information.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(confidential(?:ity)?)",
-                        r"(?i)(non-?disclosure|nda)",
-                        r"(?i)((?:proprietary|confidential)\s+information)",
-                        r"(?i)((?:shall|will)\s+(?:keep|maintain|hold)\s+(?:in\s+)?(?:confidence|confidential))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.LOI, DocumentType.TERM_SHEET, DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=8,
-                    recommendation="Include comprehensive confidentiality provisions with clear definitions, permitted disclosures, duration, and return/destruction obligations.",
-                    sub_checks=[
-                        "confidential_info_definition",
-                        "confidentiality_duration",
-                        "permitted_disclosures",
-                        "return_destruction_obligations",
-                        "survival_period"
-                    ]
-                ),
-                
-                "public_announcement_covenant": DetectionPattern(
-                    name="Public Announcement Covenant",
-                    description="Restrictions on public announcements regarding the transaction.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(public\s+(?:announcement|disclosure|statement))",
-                        r"(?i)(press\s+release)",
-                        r"(?i)((?:mutual|joint)\s+(?:consent|approval).*(?:announcement|disclosure|press))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.LOI, DocumentType.TERM_SHEET, DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=5,
-                    recommendation="Include covenant requiring mutual consent for public announcements and form of initial announcement.",
-                ),
-                
-                "books_records_covenant": DetectionPattern(
-                    name="Books and Records Covenant",
-                    description="Post-closing access to books and records.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(books\s+and\s+records)",
-                        r"(?i)((?:access|retention).*books)",
-                        r"(?i)(record\s+retention)",
-                        r"(?i)(post-?closing\s+access)",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=4,
-                    recommendation="Include covenant for post-closing access to books and records (typically for tax, litigation, or regulatory purposes).",
-                ),
-                
-                "tail_insurance_covenant": DetectionPattern(
-                    name="D&O Tail Insurance Covenant",
-                    description="Covenant to maintain or obtain tail D&O insurance for pre-closing acts.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(tail\s+(?:insurance|policy|coverage))",
-                        r"(?i)(d\s*&\s*o\s+(?:insurance|coverage))",
-                        r"(?i)(directors?\s+and\s+officers?\s+(?:insurance|indemnification))",
-                        r"(?i)(run-?off\s+(?:insurance|coverage|policy))",
-                    ],
-                    required_in=[DocumentType.MERGER_AGREEMENT],
-                    recommended_in=[DocumentType.STOCK_PURCHASE],
-                    base_risk_score=5,
-                    recommendation="Include covenant to maintain or purchase D&O tail insurance for pre-closing acts (typically 6 years).",
-                ),
-            },
-            
-            # =================================================================
-            # SECTION 6: CLOSING CONDITIONS
-            # =================================================================
-            "closing_conditions": {
-                
-                "closing_conditions_general": DetectionPattern(
-                    name="Closing Conditions Section",
-                    description="Definitive agreements must contain conditions to closing.",
-                    severity=Severity.CRITICAL,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(conditions?\s+(?:to|of|precedent\s+to)\s+(?:the\s+)?closing)",
-                        r"(?i)(closing\s+conditions?)",
-                        r"(?i)((?:condition|subject)\s+to\s+the\s+(?:satisfaction|waiver))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    recommended_in=[DocumentType.LOI, DocumentType.TERM_SHEET],
-                    base_risk_score=9,
-                    recommendation="Include comprehensive closing conditions for both buyer's and seller's obligations.",
-                ),
-                
-                "rep_accuracy_condition": DetectionPattern(
-                    name="Representation Accuracy Condition",
-                    description="Condition that representations are accurate at closing.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(representations?\s+(?:and\s+warranties?\s+)?(?:shall\s+be|are)\s+(?:true|accurate|correct))",
-                        r"(?i)((?:accuracy|truth)\s+of\s+representations?)",
-                        r"(?i)(representations?.*(?:true\s+and\s+correct|accurate).*(?:closing|date))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=8,
-                    recommendation="Include condition that reps are accurate at closing, specifying the standard (in all respects, in all material respects, or MAE-qualified).",
-                ),
-                
-                "covenant_compliance_condition": DetectionPattern(
-                    name="Covenant Compliance Condition",
-                    description="Condition that covenants have been performed/complied with.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(covenants?\s+(?:shall\s+have\s+been\s+)?(?:performed|complied|satisfied))",
-                        r"(?i)(compliance\s+with.*covenants?)",
-                        r"(?i)((?:performed|complied\s+with).*(?:all\s+)?(?:covenants?|agreements?|obligations?))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=8,
-                    recommendation="Include condition that all covenants have been performed in all material respects.",
-                ),
-                
-                "no_mac_condition": DetectionPattern(
-                    name="No MAC/MAE Condition",
-                    description="Condition that no Material Adverse Change/Effect has occurred.",
-                    severity=Severity.CRITICAL,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(no\s+material\s+adverse\s+(?:change|effect|event))",
-                        r"(?i)(mac\s+(?:condition|closing\s+condition))",
-                        r"(?i)((?:absence|no\s+occurrence)\s+of.*(?:material\s+adverse|mac|mae))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    recommended_in=[DocumentType.LOI, DocumentType.TERM_SHEET],
-                    base_risk_score=9,
-                    recommendation="Include no-MAC condition as buyer protection, with carefully defined MAC definition and appropriate carve-outs.",
-                    related_provisions=["mac_definition"]
-                ),
-                
-                "mac_definition": DetectionPattern(
-                    name="MAC/MAE Definition",
-                    description="Definition of Material Adverse Change/Effect.",
-                    severity=Severity.CRITICAL,
-                    category=Category.INCOMPLETE_DEFINITION,
-                    presence_patterns=[
-                        r"(?i)(\"material\s+adverse\s+(?:change|effect)\"|material\s+adverse\s+(?:change|effect)\s+(?:means|shall\s+mean))",
-                        r"(?i)(\"mac\"|\"mae\")",
-                        r"(?i)(material\s+adverse.*(?:means|shall\s+mean|is\s+defined))",
-                    ],
-                    vague_patterns=[
-                        r"(?i)(material\s+adverse(?!.*(?:means|shall\s+mean|carve-?out|except|other\s+than|excluding)))",  # MAC mentioned but not defined
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=9,
-                    recommendation="Define MAC carefully. Standard carve-outs include: general economic conditions, industry conditions, market conditions, natural disasters, pandemics, changes in law, and effects of transaction announcement.",
-                    sub_checks=[
-                        "mac_carveout_general_economy",
-                        "mac_carveout_industry_conditions",
-                        "mac_carveout_market_conditions",
-                        "mac_carveout_natural_disasters",
-                        "mac_carveout_pandemic",
-                        "mac_carveout_law_changes",
-                        "mac_carveout_announcement_effects",
-                        "mac_carveout_disproportionate_impact_exception"
-                    ]
-                ),
-                
-                "regulatory_approval_condition": DetectionPattern(
-                    name="Regulatory Approval Condition",
-                    description="Condition that required regulatory approvals have been obtained.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)((?:regulatory|governmental)\s+(?:approvals?|consents?|clearance).*(?:obtained|received|satisfied))",
-                        r"(?i)(hsr.*(?:waiting\s+period|expired|terminated))",
-                        r"(?i)(antitrust\s+(?:approval|clearance).*(?:condition|obtained))",
-                    ],
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include condition for expiration of HSR waiting period and receipt of any other required regulatory approvals.",
-                ),
-                
-                "shareholder_approval_condition": DetectionPattern(
-                    name="Shareholder/Board Approval Condition",
-                    description="Condition that required corporate approvals have been obtained.",
-                    severity=Severity.HIGH,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)((?:shareholder|stockholder|board|member)\s+approval)",
-                        r"(?i)((?:requisite|required)\s+(?:company|seller)?\s*(?:vote|approval))",
-                        r"(?i)(approval\s+of.*(?:shareholders?|stockholders?|board|members?))",
-                    ],
-                    absence_is_flag=True,
-                    required_in=[DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT],
-                    base_risk_score=7,
-                    recommendation="Include condition for required shareholder/board approvals, specifying vote thresholds and approval requirements.",
-                ),
-                
-                "third_party_consent_condition": DetectionPattern(
-                    name="Third Party Consent Condition",
-                    description="Condition that material third party consents have been obtained.",
-                    severity=Severity.MEDIUM,
-                    category=Category.MISSING_PROVISION,
-                    presence_patterns=[
-                        r"(?i)(third\s+party\s+consents?\s+(?:shall\s+have\s+been\s+)?(?:obtained|received))",
-                        r"(?i)(material\s+consents?\s+(?:condition|obtained))",
-                        
\ No newline at end of file
+        "document_type_identification": DetectionPattern(
+            name="Document Type Identification",
+            description="Document should clearly identify itself as LOI, Term Sheet, Purchase Agreement, etc.",
+            severity=Severity.MEDIUM,
+            category=Category.STRUCTURAL_ISSUE,
+            presence_patterns=(
+                r"(?:letter\s+of\s+intent|loi)",
+                r"(?:term\s+sheet)",
+                r"(?:stock\s+purchase\s+agreement|spa)",
+                r"(?:asset\s+purchase\s+agreement|apa)",
+                r"(?:merger\s+agreement)",
+                r"(?:agreement\s+and\s+plan\s+of\s+merger)",
+                r"(?:memorandum\s+of\s+understanding|mou)",
+            ),
+            absence_is_flag=True,
+            base_risk_score=5,
+            recommendation="Ensure document title and introductory paragraph clearly identify the document type.",
+        ),
+        
+        "party_identification": DetectionPattern(
+            name="Party Identification",
+            description="All parties must be clearly identified with full legal names, jurisdiction of organization, and roles.",
+            severity=Severity.CRITICAL,
+            category=Category.STRUCTURAL_ISSUE,
+            presence_patterns=(
+                r"(?:buyer|purchaser|acquir[oe]r)",
+                r"(?:seller|target|company)",
+                r"(?:a\s+\w+\s+(?:corporation|llc|limited|inc\.|company)\s+(?:organized|incorporated|formed))",
+                r"(?:hereinafter\s+(?:referred\s+to\s+as\s+)?[\"\']\w+[\"\'])",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.LOI, DocumentType.TERM_SHEET, DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=9,
+            recommendation="Include full legal names, entity types, jurisdictions of organization, and principal places of business for all parties.",
+            sub_checks=(
+                "buyer_legal_name",
+                "seller_legal_name",
+                "entity_type",
+                "jurisdiction_of_organization",
+                "principal_place_of_business"
+            )
+        ),
+        
+        "transaction_structure": DetectionPattern(
+            name="Transaction Structure",
+            description="The transaction structure (stock purchase, asset purchase, merger, etc.) must be clearly defined.",
+            severity=Severity.CRITICAL,
+            category=Category.STRUCTURAL_ISSUE,
+            presence_patterns=(
+                r"(?:purchase.{0,200}?(?:all|100\s*%|one\s+hundred\s+percent).{0,200}?(?:stock|shares|equity|membership\s+interests))",
+                r"(?:acquire.{0,200}?assets)",
+                r"(?:merger|merg(?:e|ing)\s+with)",
+                r"(?:stock\s+purchase|share\s+purchase|equity\s+purchase)",
+                r"(?:asset\s+purchase|asset\s+acquisition)",
+                r"(?:reverse\s+triangular\s+merger|forward\s+merger)",
+            ),
+            absence_is_flag=True,
+            base_risk_score=9,
+            recommendation="Clearly specify whether this is a stock/equity purchase, asset purchase, forward merger, reverse triangular merger, or other structure.",
+            related_provisions=("tax_treatment", "liability_assumption")
+        ),
+        
+        "recitals_background": DetectionPattern(
+            name="Recitals/Background Section",
+            description="Agreement should include recitals explaining the context and purpose of the transaction.",
+            severity=Severity.LOW,
+            category=Category.STRUCTURAL_ISSUE,
+            presence_patterns=(
+                r"(?:recitals|whereas|background)",
+                r"(?:the\s+parties\s+desire|the\s+parties\s+wish)",
+            ),
+            absence_is_flag=True,
+            recommended_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=3,
+            recommendation="Include recitals section to provide context, which aids in contract interpretation.",
+        ),
+        
+        "effective_date": DetectionPattern(
+            name="Effective Date",
+            description="Document must specify when it becomes effective.",
+            severity=Severity.HIGH,
+            category=Category.STRUCTURAL_ISSUE,
+            presence_patterns=(
+                r"(?:effective\s+(?:as\s+of|date))",
+                r"(?:dated\s+(?:as\s+of)?)",
+                r"(?:this\s+agreement.{0,200}?made.{0,200}?as\s+of)",
+                r"(?:entered\s+into\s+(?:as\s+of|on))",
+            ),
+            absence_is_flag=True,
+            base_risk_score=7,
+            recommendation="Specify the effective date clearly, either as a specific date or tied to execution.",
+        ),
+        
+        "definitions_section": DetectionPattern(
+            name="Definitions Section",
+            description="Complex agreements should have a comprehensive definitions section.",
+            severity=Severity.MEDIUM,
+            category=Category.STRUCTURAL_ISSUE,
+            presence_patterns=(
+                r"(?:definitions|defined\s+terms)",
+                r"(?:\"[A-Z][^\"]+\"\s+(?:means|shall\s+mean|has\s+the\s+meaning))",
+                r"(?:as\s+defined\s+(?:herein|below|in\s+section))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            recommended_in=(DocumentType.LOI, DocumentType.TERM_SHEET),
+            base_risk_score=6,
+            recommendation="Include comprehensive definitions section for all capitalized terms.",
+        ),
+    }
+
+
+# =============================================================================
+# SECTION 2: PURCHASE PRICE & CONSIDERATION
+# =============================================================================
+
+def _build_purchase_price() -> dict:
+    return {
+        "purchase_price_amount": DetectionPattern(
+            name="Purchase Price Specification",
+            description="The purchase price must be clearly specified or the formula for determining it must be defined.",
+            severity=Severity.CRITICAL,
+            category=Category.FINANCIAL_RISK,
+            presence_patterns=(
+                r"(?:purchase\s+price.{0,200}?\$[\d,]+)",
+                r"(?:consideration.{0,200}?\$[\d,]+)",
+                r"(?:aggregate.{0,200}?(?:purchase\s+price|consideration))",
+                r"(?:\$[\d,]+.{0,200}?(?:million|billion|thousand))",
+                r"(?:[\d.]+x\s+(?:ebitda|revenue|earnings))",  # Multiple-based pricing
+            ),
+            vague_patterns=(
+                r"(?:to\s+be\s+determined|tbd)",
+                r"(?:subject\s+to\s+(?:further\s+)?(?:discussion|negotiation|agreement))",
+                r"(?:industry\s+standard)",
+                r"(?:fair\s+market\s+value)",
+                r"(?:mutually\s+agree[d]?)",
+            ),
+            absence_is_flag=True,
+            base_risk_score=9,
+            recommendation="Specify exact purchase price or detailed formula. If using multiples, specify the exact multiple and define the metric (e.g., '5.0x TTM Adjusted EBITDA').",
+            sub_checks=(
+                "price_formula_clarity",
+                "reference_metric_definition",
+                "calculation_methodology"
+            )
+        ),
+        
+        "form_of_consideration": DetectionPattern(
+            name="Form of Consideration",
+            description="Must specify whether consideration is cash, stock, notes, or combination.",
+            severity=Severity.HIGH,
+            category=Category.FINANCIAL_RISK,
+            presence_patterns=(
+                r"(?:cash\s+consideration|paid\s+in\s+cash|cash\s+payment)",
+                r"(?:stock\s+consideration|shares\s+of\s+(?:common|preferred))",
+                r"(?:promissory\s+note|seller\s+note|deferred\s+payment)",
+                r"(?:combination\s+of\s+cash\s+and)",
+                r"(?:rollover\s+equity)",
+            ),
+            absence_is_flag=True,
+            base_risk_score=8,
+            recommendation="Clearly specify the form of consideration and breakdown if mixed.",
+            related_provisions=("stock_valuation", "note_terms")
+        ),
+        
+        "working_capital_adjustment": DetectionPattern(
+            name="Working Capital Adjustment",
+            description="Most M&A deals include working capital adjustments to the purchase price.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:working\s+capital\s+(?:adjustment|target|peg|true-?up))",
+                r"(?:net\s+working\s+capital)",
+                r"(?:current\s+assets.{0,200}?current\s+liabilities)",
+                r"(?:nwc\s+target)",
+                r"(?:closing\s+(?:date\s+)?working\s+capital)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            recommended_in=(DocumentType.LOI, DocumentType.TERM_SHEET),
+            base_risk_score=7,
+            recommendation="Include working capital adjustment mechanism with clearly defined target, calculation methodology, collar/threshold, and dispute resolution process.",
+            sub_checks=(
+                "nwc_target_amount",
+                "nwc_calculation_methodology",
+                "nwc_collar_threshold",
+                "nwc_dispute_resolution",
+                "nwc_true_up_timing"
+            )
+        ),
+        
+        "net_debt_adjustment": DetectionPattern(
+            name="Net Debt Adjustment",
+            description="Purchase price should be adjusted for debt and cash at closing.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:net\s+debt|debt-?free|cash-?free)",
+                r"(?:indebtedness.{0,200}?(?:adjustment|deducted|reduced))",
+                r"(?:closing\s+(?:date\s+)?(?:debt|indebtedness|cash))",
+                r"(?:enterprise\s+value.{0,200}?equity\s+value)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Define net debt clearly (what obligations are included) and specify adjustment mechanism.",
+            sub_checks=(
+                "debt_definition",
+                "debt_like_items",
+                "cash_definition",
+                "trapped_cash_treatment"
+            )
+        ),
+        
+        "transaction_expenses_adjustment": DetectionPattern(
+            name="Transaction Expenses Adjustment",
+            description="Specify treatment of seller's transaction expenses (legal, accounting, investment banking fees).",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:transaction\s+expenses?|seller.{0,200}?expenses?|company.{0,200}?expenses?)",
+                r"(?:unpaid.{0,200}?(?:fees|expenses).{0,200}?closing)",
+                r"(?:advisor[y]?\s+fees|investment\s+bank(?:ing|er)\s+fees)",
+            ),
+            absence_is_flag=True,
+            base_risk_score=6,
+            recommendation="Specify whether seller transaction expenses are deducted from purchase price or paid separately, with clear definition of included expenses.",
+        ),
+        
+        "earnout_provisions": DetectionPattern(
+            name="Earnout Provisions",
+            description="If purchase price includes earnouts, detailed terms must be specified.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:earn-?out|contingent\s+(?:consideration|payment)|performance\s+(?:payment|bonus))",
+                r"(?:additional\s+consideration.{0,200}?(?:based\s+on|contingent|if))",
+                r"(?:milestone\s+payment)",
+            ),
+            # Not absence_is_flag because earnouts aren't always present
+            problematic_patterns=(
+                r"(?:sole\s+discretion)",  # Too much discretion for buyer
+                r"(?:reasonable\s+efforts)",  # Vague effort standard
+            ),
+            base_risk_score=8,
+            recommendation="If earnouts present, specify: metrics (revenue, EBITDA, etc.), measurement periods, targets, calculation methodology, acceleration triggers, dispute resolution, and buyer's operational covenants.",
+            sub_checks=(
+                "earnout_metric_definition",
+                "earnout_measurement_period",
+                "earnout_targets",
+                "earnout_calculation",
+                "earnout_acceleration",
+                "earnout_dispute_mechanism",
+                "earnout_operational_covenants",
+                "earnout_accounting_principles"
+            )
+        ),
+        
+        "escrow_holdback": DetectionPattern(
+            name="Escrow/Holdback Provisions",
+            description="Standard M&A deals include escrow or holdback for indemnification claims.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:escrow|holdback|hold-?back|retained\s+amount)",
+                r"(?:escrow\s+agent|escrow\s+agreement)",
+                r"(?:indemnification\s+escrow|indemnity\s+escrow)",
+                r"(?:(?:\d+|ten|fifteen|twenty)\s*%.{0,200}?(?:escrow|holdback))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            recommended_in=(DocumentType.LOI, DocumentType.TERM_SHEET),
+            base_risk_score=7,
+            recommendation="Include escrow/holdback provisions (typically 10-15% of purchase price) with clear terms on amount, duration, release conditions, and escrow agent.",
+            sub_checks=(
+                "escrow_amount",
+                "escrow_duration",
+                "escrow_release_conditions",
+                "escrow_agent_identity",
+                "escrow_disputes"
+            )
+        ),
+        
+        "purchase_price_allocation": DetectionPattern(
+            name="Purchase Price Allocation",
+            description="For asset deals and stock deals with 338(h)(10) elections, purchase price allocation is critical for tax purposes.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:purchase\s+price\s+allocation|allocation.{0,200}?purchase\s+price)",
+                r"(?:section\s+1060|irs\s+form\s+8594)",
+                r"(?:338\s*\(?h?\)?\s*\(?\s*10\)?)",
+                r"(?:allocat(?:e|ion).{0,200}?(?:assets|goodwill|intangible))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.ASSET_PURCHASE,),
+            recommended_in=(DocumentType.STOCK_PURCHASE,),
+            base_risk_score=6,
+            recommendation="Include purchase price allocation methodology, timeline for agreement, and dispute resolution. Reference IRS Form 8594/Section 1060 for asset deals.",
+        ),
+        
+        "stock_consideration_terms": DetectionPattern(
+            name="Stock Consideration Terms",
+            description="If consideration includes stock, detailed terms must be specified.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:stock\s+consideration|share\s+consideration|equity\s+consideration)",
+                r"(?:shares\s+of\s+(?:common|preferred)\s+stock)",
+                r"(?:exchange\s+ratio)",
+                r"(?:fixed\s+(?:value|number)\s+of\s+shares)",
+            ),
+            base_risk_score=8,
+            recommendation="Specify: number of shares or exchange ratio, valuation mechanism, registration rights, lock-up periods, price protection/collars, and treatment of fractional shares.",
+            sub_checks=(
+                "share_count_or_ratio",
+                "stock_valuation_methodology",
+                "registration_rights",
+                "lock_up_provisions",
+                "price_collars",
+                "fractional_share_treatment"
+            )
+        ),
+        
+        "seller_note_terms": DetectionPattern(
+            name="Seller Note Terms",
+            description="If consideration includes seller financing, note terms must be specified.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:seller\s+note|promissory\s+note|seller\s+financ)",
+                r"(?:deferred\s+(?:purchase\s+price|payment|consideration))",
+                r"(?:subordinated\s+(?:note|debt))",
+            ),
+            base_risk_score=8,
+            recommendation="Specify: principal amount, interest rate, payment schedule, maturity, security/subordination, prepayment rights, default provisions, and acceleration triggers.",
+            sub_checks=(
+                "note_principal",
+                "note_interest_rate",
+                "note_payment_schedule",
+                "note_maturity",
+                "note_security",
+                "note_subordination",
+                "note_prepayment",
+                "note_default_triggers"
+            )
+        ),
+    }
+
+
+# =============================================================================
+# SECTION 3: DUE DILIGENCE
+# =============================================================================
+
+def _build_due_diligence() -> dict:
+    return {
+        "due_diligence_scope": DetectionPattern(
+            name="Due Diligence Scope",
+            description="The scope and categories of due diligence must be comprehensive.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:due\s+diligence|diligence\s+review|diligence\s+investigation)",
+                r"(?:access\s+to.{0,200}?(?:books|records|documents|information))",
+                r"(?:diligence\s+(?:materials?|documents?|items?))",
+            ),
+            vague_patterns=(
+                r"(?:reasonable\s+access)",
+                r"(?:customary\s+due\s+diligence)",
+                r"(?:standard\s+diligence)",
+            ),
+            absence_is_flag=True,
+            base_risk_score=8,
+            recommendation="Specify comprehensive due diligence scope covering: financials, tax, legal, IP, environmental, HR, IT, commercial, regulatory, insurance, and real estate.",
+            sub_checks=(
+                "dd_financial",
+                "dd_tax",
+                "dd_legal",
+                "dd_ip",
+                "dd_environmental",
+                "dd_hr_employment",
+                "dd_it_systems",
+                "dd_commercial",
+                "dd_regulatory",
+                "dd_insurance",
+                "dd_real_estate"
+            )
+        ),
+        
+        "due_diligence_period": DetectionPattern(
+            name="Due Diligence Period",
+            description="A specific time period for due diligence should be defined.",
+            severity=Severity.HIGH,
+            category=Category.TIMELINE_ISSUE,
+            presence_patterns=(
+                r"(?:due\s+diligence\s+period)",
+                r"(?:diligence.{0,200}?(?:days?|weeks?|period|until))",
+                r"(?:(?:\d+)\s*(?:calendar|business|working)?\s*days?.{0,200}?(?:diligence|investigation))",
+                r"(?:access.{0,200}?through|access.{0,200}?until)",
+            ),
+            absence_is_flag=True,
+            base_risk_score=7,
+            recommendation="Specify due diligence period with clear start date, end date, and any extension mechanisms.",
+        ),
+        
+        "financial_statements_access": DetectionPattern(
+            name="Financial Statements Access",
+            description="Access to financial statements and records.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:financial\s+statements?|audited\s+financials?|unaudited\s+financials?)",
+                r"(?:balance\s+sheets?|income\s+statements?|cash\s+flow)",
+                r"(?:management\s+accounts|monthly\s+financials?)",
+                r"(?:(?:three|3|five|5)\s+years?.{0,200}?financials?)",
+            ),
+            vague_patterns=(
+                r"(?:relevant\s+financial|appropriate\s+financial)",
+            ),
+            absence_is_flag=True,
+            base_risk_score=7,
+            recommendation="Specify: years of audited/unaudited financials, interim statements, management accounts, and format requirements.",
+            sub_checks=(
+                "audited_financial_years",
+                "unaudited_interim_statements",
+                "management_accounts",
+                "budget_projections",
+                "audit_workpapers"
+            )
+        ),
+        
+        "facility_access": DetectionPattern(
+            name="Facility Access",
+            description="Access to physical facilities and operations.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:facilit(?:y|ies)\s+(?:access|visit|inspection|tour))",
+                r"(?:site\s+visits?|on-?site\s+(?:access|inspection))",
+                r"(?:physical\s+inspection)",
+                r"(?:access\s+to.{0,200}?(?:premises|locations?|offices?|plants?))",
+            ),
+            absence_is_flag=True,
+            recommended_in=(DocumentType.LOI, DocumentType.TERM_SHEET),
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE),
+            base_risk_score=5,
+            recommendation="Include right to visit and inspect all material facilities, with reasonable notice requirements.",
+        ),
+        
+        "personnel_access": DetectionPattern(
+            name="Management/Personnel Access",
+            description="Access to interview key personnel and management.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:access\s+to.{0,200}?(?:management|personnel|employees|officers|key\s+people))",
+                r"(?:interview.{0,200}?(?:management|employees|personnel))",
+                r"(?:management\s+(?:meetings?|presentations?|discussions?))",
+            ),
+            absence_is_flag=True,
+            base_risk_score=5,
+            recommendation="Include right to interview management and key employees, subject to reasonable coordination with seller.",
+        ),
+        
+        "customer_vendor_access": DetectionPattern(
+            name="Customer/Vendor Access",
+            description="Access to contact customers, vendors, and business partners.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:(?:customer|vendor|supplier|client)\s+(?:access|contacts?|references?|calls?|meetings?))",
+                r"(?:contact.{0,200}?(?:customers?|vendors?|suppliers?|clients?))",
+                r"(?:customer\s+diligence|commercial\s+diligence)",
+            ),
+            base_risk_score=5,
+            recommendation="Specify whether buyer can contact customers/vendors directly or only through seller-arranged calls, and any consent requirements.",
+        ),
+        
+        "data_room_access": DetectionPattern(
+            name="Data Room Access",
+            description="Access to virtual or physical data room.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:data\s+room|virtual\s+data\s+room|vdr)",
+                r"(?:document\s+repository)",
+                r"(?:diligence\s+portal)",
+            ),
+            absence_is_flag=True,
+            recommended_in=(DocumentType.LOI, DocumentType.TERM_SHEET),
+            base_risk_score=4,
+            recommendation="Specify data room access terms, including timing, user permissions, and document production timeline.",
+        ),
+        
+        "quality_of_earnings": DetectionPattern(
+            name="Quality of Earnings Report",
+            description="Right to conduct or receive quality of earnings analysis.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:quality\s+of\s+earnings|q\s*of\s*e|qoe)",
+                r"(?:earnings\s+(?:quality|analysis|report))",
+                r"(?:financial\s+diligence\s+report)",
+            ),
+            absence_is_flag=True,
+            recommended_in=(DocumentType.LOI, DocumentType.TERM_SHEET),
+            base_risk_score=4,
+            recommendation="Include right to conduct quality of earnings analysis with access to underlying data and personnel.",
+        ),
+        
+        "environmental_diligence": DetectionPattern(
+            name="Environmental Due Diligence",
+            description="Environmental assessments and Phase I/II reports.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:environmental\s+(?:diligence|assessment|review|audit|report))",
+                r"(?:phase\s+(?:i|1|ii|2)\s+(?:environmental|assessment|report))",
+                r"(?:environmental\s+site\s+assessment|esa)",
+                r"(?:hazardous\s+(?:materials?|substances?|waste))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE),
+            base_risk_score=5,
+            recommendation="Include right to conduct Phase I (and if needed Phase II) environmental assessments.",
+        ),
+        
+        "it_systems_diligence": DetectionPattern(
+            name="IT/Systems Due Diligence",
+            description="Review of IT systems, cybersecurity, and data practices.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:it\s+(?:diligence|systems?|infrastructure|review))",
+                r"(?:cybersecurity|cyber\s+security|information\s+security)",
+                r"(?:technology\s+(?:systems?|infrastructure|review|assessment))",
+                r"(?:data\s+(?:privacy|protection|security))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE),
+            base_risk_score=5,
+            recommendation="Include IT systems review covering infrastructure, security, data privacy compliance, and technical debt.",
+        ),
+    }
+
+
+# =============================================================================
+# SECTION 4: REPRESENTATIONS & WARRANTIES
+# =============================================================================
+
+def _build_representations_warranties() -> dict:
+    return {
+        "reps_warranties_general": DetectionPattern(
+            name="Representations and Warranties Section",
+            description="Definitive agreements must contain comprehensive representations and warranties.",
+            severity=Severity.CRITICAL,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:representations?\s+and\s+warranties?)",
+                r"(?:(?:seller|company|target)\s+represents?\s+and\s+warrants?)",
+                r"(?:(?:buyer|purchaser)\s+represents?\s+and\s+warrants?)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=10,
+            recommendation="Include comprehensive representations and warranties covering all material aspects of the target business.",
+        ),
+        
+        "organization_authority_rep": DetectionPattern(
+            name="Organization and Authority Representation",
+            description="Representation that parties are validly organized and authorized to enter the transaction.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:duly\s+(?:organized|incorporated|formed))",
+                r"(?:validly\s+existing)",
+                r"(?:good\s+standing)",
+                r"(?:(?:corporate|company)\s+(?:power|authority))",
+                r"(?:duly\s+authorized)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=8,
+            recommendation="Include standard organization, valid existence, good standing, and authority representations.",
+        ),
+        
+        "capitalization_rep": DetectionPattern(
+            name="Capitalization Representation",
+            description="Representation regarding equity ownership, outstanding securities, and capital structure.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:capitalization)",
+                r"(?:authorized.{0,200}?(?:shares?|stock|capital))",
+                r"(?:issued\s+and\s+outstanding)",
+                r"(?:no\s+(?:other|additional)\s+(?:equity|shares?|securities))",
+                r"(?:(?:options?|warrants?|convertible).{0,200}?(?:outstanding|issued))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=8,
+            recommendation="Include detailed capitalization representation covering all classes of equity, options, warrants, and convertible securities.",
+        ),
+        
+        "financial_statements_rep": DetectionPattern(
+            name="Financial Statements Representation",
+            description="Representation that financial statements are accurate and prepared in accordance with GAAP.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:financial\s+statements?\s+(?:are|have\s+been|were).{0,200}?(?:prepared|accurate|true|correct))",
+                r"(?:gaap|generally\s+accepted\s+accounting\s+principles)",
+                r"(?:fairly\s+present.{0,200}?(?:financial|results|condition))",
+                r"(?:present\s+fairly.{0,200}?(?:financial\s+position|results\s+of\s+operations))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=8,
+            recommendation="Include representation that financial statements are GAAP compliant and fairly present the company's financial condition.",
+        ),
+        
+        "no_undisclosed_liabilities_rep": DetectionPattern(
+            name="No Undisclosed Liabilities Representation",
+            description="Representation that there are no material undisclosed liabilities.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:no\s+(?:undisclosed|other|additional|material)\s+liabilit(?:y|ies))",
+                r"(?:liabilities.{0,200}?(?:other\s+than|except).{0,200}?(?:financial\s+statements|disclosed))",
+                r"(?:absence\s+of.{0,200}?liabilities)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=8,
+            recommendation="Include representation regarding absence of undisclosed liabilities, with appropriate carve-outs for liabilities in the ordinary course.",
+        ),
+        
+        "litigation_rep": DetectionPattern(
+            name="Litigation Representation",
+            description="Representation regarding pending or threatened litigation.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:litigation|legal\s+proceedings?|lawsuits?|claims?)",
+                r"(?:pending\s+or\s+threatened)",
+                r"(?:no\s+(?:material\s+)?(?:litigation|proceedings?|actions?|suits?))",
+                r"(?:(?:legal|judicial|administrative)\s+(?:actions?|proceedings?))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include representation covering pending and threatened litigation, claims, investigations, and proceedings.",
+        ),
+        
+        "compliance_with_laws_rep": DetectionPattern(
+            name="Compliance with Laws Representation",
+            description="Representation regarding compliance with applicable laws and regulations.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:compliance\s+with\s+(?:applicable\s+)?laws?)",
+                r"(?:(?:in\s+)?compliance\s+(?:in\s+all\s+material\s+respects\s+)?with.{0,200}?(?:laws?|regulations?|statutes?))",
+                r"(?:legal\s+compliance)",
+                r"(?:(?:not\s+in\s+)?violation\s+of\s+(?:any\s+)?(?:laws?|regulations?))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include representation regarding compliance with all applicable laws, regulations, and governmental orders.",
+        ),
+        
+        "material_contracts_rep": DetectionPattern(
+            name="Material Contracts Representation",
+            description="Representation regarding material contracts and their status.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:material\s+contracts?)",
+                r"(?:contracts?.{0,200}?(?:schedule|exhibit|disclosure))",
+                r"(?:no\s+(?:breach|default|violation).{0,200}?(?:contracts?|agreements?))",
+                r"(?:(?:in\s+)?full\s+force\s+and\s+effect)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include representation listing all material contracts with representation that they are valid, binding, and not in breach.",
+        ),
+        
+        "intellectual_property_rep": DetectionPattern(
+            name="Intellectual Property Representation",
+            description="Representation regarding ownership and protection of intellectual property.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:intellectual\s+property|ip\s+(?:rights?|assets?))",
+                r"(?:patents?|trademarks?|copyrights?|trade\s+secrets?)",
+                r"(?:proprietary\s+(?:rights?|technology|information))",
+                r"(?:(?:owns?|ownership|title).{0,200}?(?:ip|intellectual\s+property))",
+                r"(?:no\s+(?:infringement|misappropriation))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include comprehensive IP representation covering ownership, registrations, licenses, infringement, and employee/contractor IP assignments.",
+            sub_checks=(
+                "ip_ownership",
+                "ip_registrations",
+                "ip_licenses_in",
+                "ip_licenses_out",
+                "ip_infringement",
+                "ip_assignments"
+            )
+        ),
+        
+        "employee_matters_rep": DetectionPattern(
+            name="Employee Matters Representation",
+            description="Representation regarding employees, employment agreements, and labor matters.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:employee\s+(?:matters?|relations?|list|census))",
+                r"(?:employment\s+(?:agreements?|contracts?))",
+                r"(?:labor\s+(?:matters?|relations?|disputes?|unions?))",
+                r"(?:(?:compensation|salary|benefits?|bonus).{0,200}?(?:employees?|personnel))",
+                r"(?:collective\s+bargaining)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include representation covering employee census, compensation, benefits, agreements, labor relations, and compliance with employment laws.",
+        ),
+        
+        "employee_benefits_rep": DetectionPattern(
+            name="Employee Benefits/ERISA Representation",
+            description="Representation regarding employee benefit plans and ERISA compliance.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:employee\s+benefit\s+plans?|benefit\s+plans?)",
+                r"(?:erisa|pension|retirement\s+plan)",
+                r"(?:401\s*\(?k\)?|defined\s+benefit|defined\s+contribution)",
+                r"(?:health\s+(?:insurance|plan|benefits?))",
+                r"(?:multiemployer\s+plan)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include comprehensive ERISA representation covering all benefit plans, qualified status, funding, prohibited transactions, and multiemployer plan liability.",
+        ),
+        
+        "tax_rep": DetectionPattern(
+            name="Tax Representation",
+            description="Representation regarding tax matters, filings, and liabilities.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:tax\s+(?:matters?|returns?|liabilit(?:y|ies)|filings?))",
+                r"(?:filed\s+(?:all\s+)?(?:required\s+)?tax\s+returns?)",
+                r"(?:(?:paid|payment\s+of)\s+(?:all\s+)?taxes)",
+                r"(?:no\s+(?:tax\s+)?(?:audits?|examinations?|assessments?))",
+                r"(?:tax\s+(?:deficienc(?:y|ies)|claims?))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include comprehensive tax representation covering filings, payments, audits, reserves, transfer pricing, and net operating losses.",
+        ),
+        
+        "environmental_rep": DetectionPattern(
+            name="Environmental Representation",
+            description="Representation regarding environmental compliance and liabilities.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:environmental\s+(?:matters?|compliance|laws?|liabilit(?:y|ies)|permits?))",
+                r"(?:hazardous\s+(?:substances?|materials?|waste))",
+                r"(?:environmental\s+(?:contamination|remediation|cleanup))",
+                r"(?:cercla|superfund|rcra)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include environmental representation covering compliance, permits, contamination, remediation obligations, and environmental liabilities.",
+        ),
+        
+        "insurance_rep": DetectionPattern(
+            name="Insurance Representation",
+            description="Representation regarding insurance coverage.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:insurance\s+(?:polic(?:y|ies)|coverage|matters?))",
+                r"(?:(?:adequate|sufficient)\s+insurance)",
+                r"(?:insured\s+(?:against|for))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=5,
+            recommendation="Include representation regarding adequacy of insurance coverage, claims history, and policy status.",
+        ),
+        
+        "real_property_rep": DetectionPattern(
+            name="Real Property Representation",
+            description="Representation regarding owned and leased real property.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:real\s+property|real\s+estate)",
+                r"(?:owned\s+(?:real\s+)?propert(?:y|ies))",
+                r"(?:leased\s+(?:real\s+)?propert(?:y|ies)|lease(?:d|s)\s+premises)",
+                r"(?:(?:title|ownership)\s+to\s+(?:real\s+)?property)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=5,
+            recommendation="Include representation covering owned real property (title, liens, encumbrances) and leased property (lease terms, compliance, landlord consents).",
+        ),
+        
+        "related_party_transactions_rep": DetectionPattern(
+            name="Related Party Transactions Representation",
+            description="Representation regarding transactions with related parties.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:related\s+party\s+(?:transactions?|agreements?|arrangements?))",
+                r"(?:affiliate\s+(?:transactions?|agreements?|contracts?))",
+                r"(?:(?:transactions?|dealings?)\s+with\s+(?:affiliates?|related\s+parties?))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=6,
+            recommendation="Include representation disclosing all related party transactions and agreements that will continue post-closing.",
+        ),
+        
+        "brokers_rep": DetectionPattern(
+            name="Brokers/Finders Fee Representation",
+            description="Representation regarding broker and finder fees.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:brokers?|finders?|investment\s+bank(?:ers?)?)",
+                r"(?:(?:broker(?:age)?|finder(?:\'?s)?)\s+fees?)",
+                r"(?:no\s+(?:other\s+)?(?:broker|finder|agent))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=5,
+            recommendation="Include representation that no broker or finder fees are owed except as disclosed, with indemnification for any undisclosed fees.",
+        ),
+        
+        "data_privacy_rep": DetectionPattern(
+            name="Data Privacy/Cybersecurity Representation",
+            description="Representation regarding data privacy and cybersecurity.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:data\s+(?:privacy|protection|security))",
+                r"(?:privacy\s+(?:laws?|policies?|compliance))",
+                r"(?:gdpr|ccpa|hipaa|pci)",
+                r"(?:personal\s+(?:data|information)|pii)",
+                r"(?:cybersecurity|cyber\s+security|data\s+breach)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include representation covering data privacy compliance (GDPR, CCPA, HIPAA as applicable), privacy policies, data security measures, and breach history.",
+        ),
+        
+        "anti_corruption_rep": DetectionPattern(
+            name="Anti-Corruption/FCPA Representation",
+            description="Representation regarding anti-bribery and anti-corruption compliance.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:anti-?corruption|anti-?bribery)",
+                r"(?:fcpa|foreign\s+corrupt\s+practices\s+act)",
+                r"(?:uk\s+bribery\s+act)",
+                r"(?:corrupt\s+(?:payments?|practices?))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include representation regarding FCPA and anti-corruption compliance, especially for targets with international operations.",
+        ),
+        
+        "sanctions_export_rep": DetectionPattern(
+            name="Sanctions/Export Control Representation",
+            description="Representation regarding sanctions and export control compliance.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:sanctions?|ofac|sdn\s+list)",
+                r"(?:export\s+control|ear|itar)",
+                r"(?:(?:trade|economic)\s+sanctions?)",
+                r"(?:(?:restricted|denied)\s+part(?:y|ies))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include representation regarding OFAC sanctions compliance and export control compliance (EAR, ITAR as applicable).",
+        ),
+        
+        "no_other_reps_warranty": DetectionPattern(
+            name="No Other Representations Clause",
+            description="Clause disclaiming representations other than those expressly made.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:no\s+other\s+representations?)",
+                r"(?:(?:except\s+(?:for|as)).{0,200}?(?:expressly|specifically)\s+(?:set\s+forth|made|stated))",
+                r"(?:disclaim(?:s|ing)?\s+(?:all\s+)?(?:other\s+)?(?:representations?|warranties?))",
+                r"(?:as-?is)",
+            ),
+            base_risk_score=5,
+            recommendation="Consider adding disclaimer of extra-contractual representations to limit liability exposure.",
+        ),
+        
+        "knowledge_qualifiers": DetectionPattern(
+            name="Knowledge Qualifiers Definition",
+            description="Definition of 'knowledge' for purposes of qualified representations.",
+            severity=Severity.MEDIUM,
+            category=Category.INCOMPLETE_DEFINITION,
+            presence_patterns=(
+                r"(?:\"knowledge\"|knowledge\s+of\s+(?:seller|company)|seller(?:\'s|s)?\s+knowledge)",
+                r"(?:to\s+the\s+knowledge\s+of)",
+                r"(?:actual\s+knowledge|constructive\s+knowledge)",
+                r"(?:knowledge.{0,200}?(?:means|shall\s+mean|defined))",
+            ),
+            vague_patterns=(
+                r"(?:best\s+of.{0,200}?knowledge)",  # Vague knowledge standard
+            ),
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=6,
+            recommendation="Define 'knowledge' precisely, including whether it's actual or constructive knowledge, and identify the individuals whose knowledge is attributed to the company.",
+        ),
+        
+        "materiality_qualifiers": DetectionPattern(
+            name="Materiality/MAE Qualifiers",
+            description="Use and definition of materiality qualifiers and Material Adverse Effect.",
+            severity=Severity.HIGH,
+            category=Category.AMBIGUITY,
+            presence_patterns=(
+                r"(?:material\s+adverse\s+(?:effect|change|event)|mae|mac)",
+                r"(?:\"material\"|material\s+(?:means|shall\s+mean))",
+                r"(?:in\s+all\s+material\s+respects)",
+            ),
+            problematic_patterns=(
+                r"(?:double\s+material)",  # Double materiality scrape
+            ),
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Define Material Adverse Effect/Change carefully with appropriate carve-outs. Be consistent in application of materiality qualifiers.",
+        ),
+        
+        "disclosure_schedules_reference": DetectionPattern(
+            name="Disclosure Schedules Reference",
+            description="Reference to and requirements for disclosure schedules.",
+            severity=Severity.HIGH,
+            category=Category.STRUCTURAL_ISSUE,
+            presence_patterns=(
+                r"(?:disclosure\s+(?:schedules?|letter))",
+                r"(?:schedule\s+\d+\.\d+)",
+                r"(?:set\s+forth\s+(?:on|in)\s+schedule)",
+                r"(?:seller\s+disclosure\s+(?:schedule|letter))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include comprehensive disclosure schedules and specify updating mechanism, cross-reference rules, and standard for disclosure (specific vs. general).",
+        ),
+    }
+
+
+# =============================================================================
+# SECTION 5: COVENANTS
+# =============================================================================
+
+def _build_covenants() -> dict:
+    return {
+        "pre_closing_covenants_general": DetectionPattern(
+            name="Pre-Closing Covenants Section",
+            description="Covenants governing conduct between signing and closing.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:pre-?closing\s+covenants?|covenants?\s+(?:prior\s+to|pending)\s+closing)",
+                r"(?:between\s+(?:signing|execution|the\s+date\s+hereof)\s+and\s+(?:closing|the\s+closing\s+date))",
+                r"(?:conduct\s+of\s+(?:the\s+)?business)",
+                r"(?:interim\s+(?:period|covenants?|operating\s+covenants?))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=8,
+            recommendation="Include comprehensive pre-closing covenants governing business operations between signing and closing.",
+        ),
+        
+        "ordinary_course_covenant": DetectionPattern(
+            name="Ordinary Course of Business Covenant",
+            description="Covenant to operate business in ordinary course pending closing.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:ordinary\s+course\s+of\s+business)",
+                r"(?:conduct\s+(?:of\s+)?(?:the\s+)?business\s+in\s+the\s+ordinary\s+course)",
+                r"(?:consistent\s+with\s+past\s+practice)",
+            ),
+            vague_patterns=(
+                r"(?:ordinary\s+course(?!\s+of\s+business))",  # Missing "of business"
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=8,
+            recommendation="Define ordinary course precisely and include specific permitted/prohibited actions list.",
+        ),
+        
+        "negative_covenants": DetectionPattern(
+            name="Negative/Restrictive Covenants",
+            description="Specific restrictions on seller's conduct pending closing.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:shall\s+not.{0,200}?without.{0,200}?(?:prior\s+)?(?:written\s+)?consent)",
+                r"(?:(?:seller|company|target)\s+shall\s+not)",
+                r"(?:prohibited\s+(?:actions?|conduct))",
+                r"(?:negative\s+covenants?|restrictive\s+covenants?)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include specific negative covenants covering: equity issuances, dividends, asset sales, debt incurrence, capex, material contracts, employment changes, etc.",
+            sub_checks=(
+                "no_equity_issuance",
+                "no_dividends",
+                "no_asset_sales",
+                "no_debt_incurrence",
+                "capex_restrictions",
+                "contract_restrictions",
+                "employment_restrictions",
+                "accounting_method_restrictions"
+            )
+        ),
+        
+        "access_covenant": DetectionPattern(
+            name="Access Covenant",
+            description="Ongoing access to information and personnel pending closing.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:access.{0,200}?(?:pending|prior\s+to)\s+closing)",
+                r"(?:continued\s+access)",
+                r"(?:access\s+to.{0,200}?(?:books|records|personnel|facilities))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=5,
+            recommendation="Include covenant for continued access to information, personnel, and facilities pending closing.",
+        ),
+        
+        "notification_covenant": DetectionPattern(
+            name="Notification/Update Covenant",
+            description="Obligation to notify of material changes or breaches.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:(?:shall|will)\s+(?:promptly\s+)?(?:notify|inform|advise))",
+                r"(?:notification\s+(?:covenant|obligation))",
+                r"(?:notice\s+of.{0,200}?(?:material|breach|change))",
+                r"(?:update.{0,200}?(?:disclosure|schedules?))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=5,
+            recommendation="Include covenant requiring prompt notification of material developments, rep breaches, and schedule updates.",
+        ),
+        
+        "efforts_to_close_covenant": DetectionPattern(
+            name="Efforts to Close Covenant",
+            description="Covenant regarding efforts to satisfy closing conditions and consummate transaction.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:(?:commercially\s+)?reasonable\s+(?:best\s+)?efforts)",
+                r"(?:best\s+efforts)",
+                r"(?:use\s+(?:its|their)\s+(?:commercially\s+)?reasonable\s+efforts)",
+                r"(?:efforts\s+to\s+(?:consummate|close|satisfy))",
+            ),
+            vague_patterns=(
+                r"(?:reasonable\s+efforts(?!\s+(?:to|covenant)))",  # Standalone without context
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Specify effort standard (best efforts vs. commercially reasonable efforts) and what it requires.",
+        ),
+        
+        "regulatory_approval_covenant": DetectionPattern(
+            name="Regulatory Approval Covenant",
+            description="Covenant regarding obtaining required regulatory approvals.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:(?:regulatory|governmental)\s+(?:approvals?|consents?|filings?))",
+                r"(?:hsr|hart-?scott-?rodino)",
+                r"(?:antitrust\s+(?:approval|clearance|filing))",
+                r"(?:cfius|(?:foreign\s+)?investment\s+review)",
+                r"(?:fcc|fda|(?:sec|securities)\s+(?:approval|filing))",
+            ),
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include specific covenants for required regulatory filings (HSR, CFIUS, industry-specific) with timing requirements and cooperation obligations.",
+            sub_checks=(
+                "hsr_filing_covenant",
+                "cfius_review",
+                "industry_regulatory_approvals",
+                "state_approvals",
+                "foreign_approvals"
+            )
+        ),
+        
+        "hell_or_high_water_covenant": DetectionPattern(
+            name="Hell or High Water/Divestiture Covenant",
+            description="Commitment regarding divestitures or remedies for regulatory approval.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:hell\s+or\s+high\s+water)",
+                r"(?:divest(?:iture)?|hold\s+separate|behavioral\s+remed(?:y|ies))",
+                r"(?:antitrust\s+(?:remed(?:y|ies)|commitment))",
+            ),
+            required_in=(DocumentType.MERGER_AGREEMENT,),  # Primarily large public deals
+            base_risk_score=6,
+            recommendation="For deals requiring antitrust approval, specify whether buyer must accept divestitures or behavioral remedies (hell or high water) or if there are limits.",
+        ),
+        
+        "third_party_consents_covenant": DetectionPattern(
+            name="Third Party Consents Covenant",
+            description="Covenant to obtain required third party consents.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:third\s+party\s+consents?)",
+                r"(?:consents?\s+(?:required|necessary|needed))",
+                r"(?:change\s+of\s+control\s+consents?)",
+                r"(?:landlord\s+consents?|customer\s+consents?|vendor\s+consents?)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=5,
+            recommendation="Include covenant to use efforts to obtain required third party consents, with list of material consents required as closing condition.",
+        ),
+        
+        "exclusivity_noshop": DetectionPattern(
+            name="Exclusivity/No-Shop Provision",
+            description="Restriction on seller's ability to solicit or engage with other potential buyers.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:exclusivity|exclusive\s+(?:dealing|negotiation|right))",
+                r"(?:no-?shop|no\s+shop)",
+                r"(?:no-?solicitation|no\s+solicitation)",
+                r"(?:shall\s+not.{0,200}?(?:solicit|encourage|initiate|negotiate).{0,200}?(?:other|alternative|competing))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.LOI, DocumentType.TERM_SHEET),
+            recommended_in=(DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include no-shop provision with clear scope, duration, and any fiduciary out carve-outs.",
+            sub_checks=(
+                "exclusivity_duration",
+                "exclusivity_scope",
+                "fiduciary_out",
+                "matching_rights",
+                "window_shop"
+            )
+        ),
+        
+        "fiduciary_out": DetectionPattern(
+            name="Fiduciary Out",
+            description="Carve-out allowing seller to respond to unsolicited superior proposals.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:fiduciary\s+(?:out|exception|duties?))",
+                r"(?:superior\s+proposal)",
+                r"(?:intervening\s+event)",
+                r"(?:board.{0,200}?fiduciary\s+(?:duties?|obligations?))",
+            ),
+            recommended_in=(DocumentType.MERGER_AGREEMENT,),
+            base_risk_score=5,
+            recommendation="For public company deals, consider fiduciary out provisions allowing board to respond to unsolicited superior proposals.",
+        ),
+        
+        "employee_retention_covenant": DetectionPattern(
+            name="Employee Retention Covenant",
+            description="Covenants regarding treatment and retention of employees.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:employee\s+(?:retention|matters?|continuation|treatment))",
+                r"(?:retain(?:ing)?\s+(?:key\s+)?employees?)",
+                r"(?:employment\s+(?:offers?|continuation))",
+                r"(?:(?:key|critical)\s+employees?)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=5,
+            recommendation="Include provisions regarding employee treatment, retention bonuses, and employment offers.",
+        ),
+        
+        "non_compete_covenant": DetectionPattern(
+            name="Non-Competition Covenant",
+            description="Post-closing non-compete restrictions on seller/principals.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:non-?competition?|(?:shall|will)\s+not\s+compete)",
+                r"(?:restrictive\s+covenant)",
+                r"(?:covenant\s+not\s+to\s+compete)",
+                r"(?:competitive\s+(?:business|activit(?:y|ies)))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include non-compete with clear scope (geographic, business lines), duration, and covered persons.",
+            sub_checks=(
+                "noncompete_duration",
+                "noncompete_geographic_scope",
+                "noncompete_business_scope",
+                "noncompete_covered_persons"
+            )
+        ),
+        
+        "non_solicit_covenant": DetectionPattern(
+            name="Non-Solicitation Covenant",
+            description="Post-closing restrictions on soliciting employees or customers.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:non-?solicitation?|(?:shall|will)\s+not\s+solicit)",
+                r"(?:(?:not|refrain\s+from)\s+solicit(?:ing)?.{0,200}?(?:employees?|customers?))",
+                r"(?:(?:employee|customer)\s+non-?solicitation?)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=6,
+            recommendation="Include non-solicitation of employees and customers with clear scope and duration.",
+            sub_checks=(
+                "employee_nonsolicit_duration",
+                "customer_nonsolicit_duration",
+                "covered_employees",
+                "covered_customers"
+            )
+        ),
+        
+        "confidentiality_covenant": DetectionPattern(
+            name="Confidentiality Covenant",
+            description="Confidentiality obligations regarding transaction and business information.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:confidential(?:ity)?)",
+                r"(?:non-?disclosure|nda)",
+                r"(?:(?:proprietary|confidential)\s+information)",
+                r"(?:(?:shall|will)\s+(?:keep|maintain|hold)\s+(?:in\s+)?(?:confidence|confidential))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.LOI, DocumentType.TERM_SHEET, DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=8,
+            recommendation="Include comprehensive confidentiality provisions with clear definitions, permitted disclosures, duration, and return/destruction obligations.",
+            sub_checks=(
+                "confidential_info_definition",
+                "confidentiality_duration",
+                "permitted_disclosures",
+                "return_destruction_obligations",
+                "survival_period"
+            )
+        ),
+        
+        "public_announcement_covenant": DetectionPattern(
+            name="Public Announcement Covenant",
+            description="Restrictions on public announcements regarding the transaction.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:public\s+(?:announcement|disclosure|statement))",
+                r"(?:press\s+release)",
+                r"(?:(?:mutual|joint)\s+(?:consent|approval).{0,200}?(?:announcement|disclosure|press))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.LOI, DocumentType.TERM_SHEET, DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=5,
+            recommendation="Include covenant requiring mutual consent for public announcements and form of initial announcement.",
+        ),
+        
+        "books_records_covenant": DetectionPattern(
+            name="Books and Records Covenant",
+            description="Post-closing access to books and records.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:books\s+and\s+records)",
+                r"(?:(?:access|retention).{0,200}?books)",
+                r"(?:record\s+retention)",
+                r"(?:post-?closing\s+access)",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=4,
+            recommendation="Include covenant for post-closing access to books and records (typically for tax, litigation, or regulatory purposes).",
+        ),
+        
+        "tail_insurance_covenant": DetectionPattern(
+            name="D&O Tail Insurance Covenant",
+            description="Covenant to maintain or obtain tail D&O insurance for pre-closing acts.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:tail\s+(?:insurance|policy|coverage))",
+                r"(?:d\s*&\s*o\s+(?:insurance|coverage))",
+                r"(?:directors?\s+and\s+officers?\s+(?:insurance|indemnification))",
+                r"(?:run-?off\s+(?:insurance|coverage|policy))",
+            ),
+            required_in=(DocumentType.MERGER_AGREEMENT,),
+            recommended_in=(DocumentType.STOCK_PURCHASE,),
+            base_risk_score=5,
+            recommendation="Include covenant to maintain or purchase D&O tail insurance for pre-closing acts (typically 6 years).",
+        ),
+    }
+
+
+# =============================================================================
+# SECTION 6: CLOSING CONDITIONS
+# =============================================================================
+
+def _build_closing_conditions() -> dict:
+    return {
+        "closing_conditions_general": DetectionPattern(
+            name="Closing Conditions Section",
+            description="Definitive agreements must contain conditions to closing.",
+            severity=Severity.CRITICAL,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:conditions?\s+(?:to|of|precedent\s+to)\s+(?:the\s+)?closing)",
+                r"(?:closing\s+conditions?)",
+                r"(?:(?:condition|subject)\s+to\s+the\s+(?:satisfaction|waiver))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            recommended_in=(DocumentType.LOI, DocumentType.TERM_SHEET),
+            base_risk_score=9,
+            recommendation="Include comprehensive closing conditions for both buyer's and seller's obligations.",
+        ),
+        
+        "rep_accuracy_condition": DetectionPattern(
+            name="Representation Accuracy Condition",
+            description="Condition that representations are accurate at closing.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:representations?\s+(?:and\s+warranties?\s+)?(?:shall\s+be|are)\s+(?:true|accurate|correct))",
+                r"(?:(?:accuracy|truth)\s+of\s+representations?)",
+                r"(?:representations?.{0,200}?(?:true\s+and\s+correct|accurate).{0,200}?(?:closing|date))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=8,
+            recommendation="Include condition that reps are accurate at closing, specifying the standard (in all respects, in all material respects, or MAE-qualified).",
+        ),
+        
+        "covenant_compliance_condition": DetectionPattern(
+            name="Covenant Compliance Condition",
+            description="Condition that covenants have been performed/complied with.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:covenants?\s+(?:shall\s+have\s+been\s+)?(?:performed|complied|satisfied))",
+                r"(?:compliance\s+with.{0,200}?covenants?)",
+                r"(?:(?:performed|complied\s+with).{0,200}?(?:all\s+)?(?:covenants?|agreements?|obligations?))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=8,
+            recommendation="Include condition that all covenants have been performed in all material respects.",
+        ),
+        
+        "no_mac_condition": DetectionPattern(
+            name="No MAC/MAE Condition",
+            description="Condition that no Material Adverse Change/Effect has occurred.",
+            severity=Severity.CRITICAL,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:no\s+material\s+adverse\s+(?:change|effect|event))",
+                r"(?:mac\s+(?:condition|closing\s+condition))",
+                r"(?:(?:absence|no\s+occurrence)\s+of.{0,200}?(?:material\s+adverse|mac|mae))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            recommended_in=(DocumentType.LOI, DocumentType.TERM_SHEET),
+            base_risk_score=9,
+            recommendation="Include no-MAC condition as buyer protection, with carefully defined MAC definition and appropriate carve-outs.",
+            related_provisions=("mac_definition",)
+        ),
+        
+        "mac_definition": DetectionPattern(
+            name="MAC/MAE Definition",
+            description="Definition of Material Adverse Change/Effect.",
+            severity=Severity.CRITICAL,
+            category=Category.INCOMPLETE_DEFINITION,
+            presence_patterns=(
+                r"(?:\"material\s+adverse\s+(?:change|effect)\"|material\s+adverse\s+(?:change|effect)\s+(?:means|shall\s+mean))",
+                r"(?:\"mac\"|\"mae\")",
+                r"(?:material\s+adverse.{0,200}?(?:means|shall\s+mean|is\s+defined))",
+            ),
+            vague_patterns=(
+                r"(?:material\s+adverse(?!.*(?:means|shall\s+mean|carve-?out|except|other\s+than|excluding)))",  # MAC mentioned but not defined
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.ASSET_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=9,
+            recommendation="Define MAC carefully. Standard carve-outs include: general economic conditions, industry conditions, market conditions, natural disasters, pandemics, changes in law, and effects of transaction announcement.",
+            sub_checks=(
+                "mac_carveout_general_economy",
+                "mac_carveout_industry_conditions",
+                "mac_carveout_market_conditions",
+                "mac_carveout_natural_disasters",
+                "mac_carveout_pandemic",
+                "mac_carveout_law_changes",
+                "mac_carveout_announcement_effects",
+                "mac_carveout_disproportionate_impact_exception"
+            )
+        ),
+        
+        "regulatory_approval_condition": DetectionPattern(
+            name="Regulatory Approval Condition",
+            description="Condition that required regulatory approvals have been obtained.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:(?:regulatory|governmental)\s+(?:approvals?|consents?|clearance).{0,200}?(?:obtained|received|satisfied))",
+                r"(?:hsr.{0,200}?(?:waiting\s+period|expired|terminated))",
+                r"(?:antitrust\s+(?:approval|clearance).{0,200}?(?:condition|obtained))",
+            ),
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include condition for expiration of HSR waiting period and receipt of any other required regulatory approvals.",
+        ),
+        
+        "shareholder_approval_condition": DetectionPattern(
+            name="Shareholder/Board Approval Condition",
+            description="Condition that required corporate approvals have been obtained.",
+            severity=Severity.HIGH,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:(?:shareholder|stockholder|board|member)\s+approval)",
+                r"(?:(?:requisite|required)\s+(?:company|seller)?\s*(?:vote|approval))",
+                r"(?:approval\s+of.{0,200}?(?:shareholders?|stockholders?|board|members?))",
+            ),
+            absence_is_flag=True,
+            required_in=(DocumentType.STOCK_PURCHASE, DocumentType.MERGER_AGREEMENT),
+            base_risk_score=7,
+            recommendation="Include condition for required shareholder/board approvals, specifying vote thresholds and approval requirements.",
+        ),
+        
+        "third_party_consent_condition": DetectionPattern(
+            name="Third Party Consent Condition",
+            description="Condition that material third party consents have been obtained.",
+            severity=Severity.MEDIUM,
+            category=Category.MISSING_PROVISION,
+            presence_patterns=(
+                r"(?:third\s+party\s+consents?\s+(?:shall\s+have\s+been\s+)?(?:obtained|received))",
+                r"(?:material\s+consents?\s+(?:condition|obtained))",
+            ),
+        ),
+    }
+
+
+# Section name -> builder, in library order
+_SECTION_BUILDERS = {
+    "structural": _build_structural,
+    "purchase_price": _build_purchase_price,
+    "due_diligence": _build_due_diligence,
+    "representations_warranties": _build_representations_warranties,
+    "covenants": _build_covenants,
+    "closing_conditions": _build_closing_conditions,
+}
+
+
+# =============================================================================
+# PROVISION IDS
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def get_provision_ids() -> tuple:
+    """
+    Returns (ProvisionId, PROVISIONS_BY_ID, PROVISION_KEYS). ProvisionId is an
+    IntEnum with one member per provision key (upper-cased), numbered in library
+    order; PROVISIONS_BY_ID[i] and PROVISION_KEYS[i] belong to ProvisionId(i).
+    """
+    provisions = [
+        (key, pattern)
+        for section in MAAProvisionLibrary.get_all_provisions().values()
+        for key, pattern in section.items()
+    ]
+    provision_id = IntEnum(
+        "ProvisionId",
+        [(key.upper(), i) for i, (key, _) in enumerate(provisions)],
+        module=__name__,
+    )
+    return (
+        provision_id,
+        tuple(pattern for _, pattern in provisions),
+        tuple(key for key, _ in provisions),
+    )
+
+
+def _applies_to(pattern: DetectionPattern, doc_type: DocumentType) -> bool:
+    """Provisions without required_in/recommended_in apply to every document type"""
+    return bool(pattern._scope_mask & doc_type)
+
+
+@lru_cache(maxsize=1)
+def get_patterns_by_doctype() -> Mapping:
+    """DocumentType -> tuple of the ProvisionIds that apply to it (see _applies_to)"""
+    provision_id, provisions_by_id, _ = get_provision_ids()
+    return MappingProxyType({
+        doc_type: tuple(
+            provision_id(i) for i, pattern in enumerate(provisions_by_id) if _applies_to(pattern, doc_type)
+        )
+        for doc_type in DocumentType
+    })
+
+
+_PROVISION_ID_EXPORTS = ("ProvisionId", "PROVISIONS_BY_ID", "PROVISION_KEYS")
+
+
+def __getattr__(name: str):
+    # The provision id exports are generated from the library on first access
+    if name in _PROVISION_ID_EXPORTS:
+        return get_provision_ids()[_PROVISION_ID_EXPORTS.index(name)]
+    if name == "PATTERNS_BY_DOCTYPE":
+        return get_patterns_by_doctype()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# =============================================================================
+# FUSED PRESENCE SCANNING
+# =============================================================================
+
+def build_master_regex(patterns) -> re.Pattern:
+    """
+    Fuses the presence patterns of every DetectionPattern into one alternation.
+    Group "p<i>" wraps the alternatives of patterns[i], so match.lastgroup
+    identifies which provision fired.
+    """
+    return _compile_source(
+        "|".join(
+            f"(?P<p{i}>{'|'.join(_normalize_source(p) for p in pattern.presence_patterns)})"
+            for i, pattern in enumerate(patterns)
+            if pattern.presence_patterns
+        ),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_master_regex(doc_type: DocumentType) -> tuple:
+    """Returns (provision_keys, patterns, master_regex) for the provisions applicable to doc_type"""
+    _, provisions_by_id, provision_keys = get_provision_ids()
+    ids = [pid for pid in get_patterns_by_doctype()[doc_type] if provisions_by_id[pid].presence_patterns]
+    keys = tuple(provision_keys[pid] for pid in ids)
+    patterns = tuple(provisions_by_id[pid] for pid in ids)
+    return keys, patterns, build_master_regex(patterns)
+
+
+@lru_cache(maxsize=None)
+def get_section_regex(section: str) -> tuple:
+    """Returns (provision_keys, patterns, master_regex) for one library section (e.g. covenants)"""
+    provisions = [
+        (key, pattern)
+        for key, pattern in MAAProvisionLibrary.get_section(section).items()
+        if pattern.presence_patterns
+    ]
+    keys = tuple(key for key, _ in provisions)
+    patterns = tuple(pattern for _, pattern in provisions)
+    return keys, patterns, build_master_regex(patterns)
+
+
+@lru_cache(maxsize=1)
+def _literal_automaton():
+    """
+    One Aho-Corasick automaton over every provision's literal presence
+    phrases, valued with the ProvisionIds using each phrase, shared by all
+    doc-type and section scans; None without pyahocorasick.
+    """
+    if ahocorasick is None:
+        return None
+    _, provisions_by_id, _ = get_provision_ids()
+    owners = {}
+    for pid, pattern in enumerate(provisions_by_id):
+        for phrase in pattern._presence_literals:
+            owners.setdefault(phrase, []).append(pid)
+    automaton = ahocorasick.Automaton()
+    for phrase, pids in owners.items():
+        automaton.add_word(phrase, tuple(pids))
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=None)
+def _literal_owners(patterns: tuple) -> tuple:
+    """(ProvisionId, index in patterns) for each of patterns that has literal phrases"""
+    _, provisions_by_id, _ = get_provision_ids()
+    pids = {id(pattern): pid for pid, pattern in enumerate(provisions_by_id)}
+    return tuple((pids[id(pattern)], i) for i, pattern in enumerate(patterns) if pattern._presence_literals)
+
+
+def _fused_presence(document: ScanDocument, patterns: tuple, master_regex: re.Pattern) -> set:
+    """
+    Returns the indices of patterns with a presence match in document.
+    
+    A single finditer pass over the fused regex finds most hits. Fused matches
+    cannot overlap, so provisions the pass did not see are confirmed with their
+    own literals and compiled patterns before being reported absent. With
+    pyahocorasick installed, every literal phrase is resolved up front by the
+    document's single library-wide automaton pass instead.
+    """
+    lowered = document.lowered
+    literal_hits = document.literal_hits
+    if literal_hits is None:
+        hits = set()
+    else:
+        # Reports overlapping phrases too, so no literal needs re-checking below
+        hits = {i for pid, i in _literal_owners(patterns) if pid in literal_hits}
+    if len(hits) < len(patterns):
+        for match in master_regex.finditer(lowered):
+            hits.add(int(match.lastgroup[1:]))
+            if len(hits) == len(patterns):
+                # Presence only needs one match per provision; stop once all have fired
+                break
+    for i, pattern in enumerate(patterns):
+        if i in hits:
+            continue
+        # Plain substring checks first; the regex engine only runs when no literal hit
+        if literal_hits is None and pattern._presence_literals:
+            folded = document.folded
+            if any(literal in folded for literal in pattern._presence_literals):
+                hits.add(i)
+                continue
+        if pattern._presence_union is None:
+            continue
+        # Same for the union: a cheap needle check before the regex engine runs
+        terms = pattern._presence_terms
+        if terms is not None and not any(term in document.terms for term in terms):
+            continue
+        if pattern._presence_union.search(lowered):
+            hits.add(i)
+    return hits
+
+
+def scan_presence(text: str, doc_type: DocumentType) -> set:
+    """Returns the keys of provisions applicable to doc_type whose presence patterns match text"""
+    keys, patterns, master_regex = get_master_regex(doc_type)
+    return {keys[i] for i in _fused_presence(_as_document(text), patterns, master_regex)}
+
+
+def scan_section(text: str, section: str) -> set:
+    """Returns the keys of one section's provisions whose presence patterns match text"""
+    keys, patterns, master_regex = get_section_regex(section)
+    return {keys[i] for i in _fused_presence(_as_document(text), patterns, master_regex)}
+
+
+# =============================================================================
+# LIBRARY-WIDE PATTERN SCANNING
+# =============================================================================
+
+_KIND_FIELDS = (
+    (MatchKind.PRESENCE, "presence_patterns"),
+    (MatchKind.VAGUE, "vague_patterns"),
+    (MatchKind.PROBLEMATIC, "problematic_patterns"),
+)
+
+
+def scan_library(text: str) -> dict:
+    """
+    Returns {provision_key: MatchKind} for every provision with at least one
+    matching pattern list; the keyed view of scan_flat()'s bitmap.
+    """
+    provision_keys = get_flat_table().provision_keys
+    return {provision_keys[pid]: MatchKind(bits) for pid, bits in enumerate(scan_flat(text)) if bits}
+
+
+# =============================================================================
+# FLAT PATTERN TABLE
+# =============================================================================
+
+class PatternTable(NamedTuple):
+    """
+    Structure-of-arrays view of the library: index i of patterns, kinds,
+    and provision_idx all describe the same compiled pattern, and
+    index i of the provision_* columns describes ProvisionId i.
+    """
+    provision_keys: tuple  # ProvisionId -> provision key
+    patterns: tuple  # compiled re.Pattern per library pattern
+    kinds: array  # MatchKind bit of the list each pattern came from
+    provision_idx: array  # ProvisionId of the owning provision
+    provision_score: array  # ProvisionId -> Severity << 4 | base_risk_score
+    required_terms: tuple  # substrings one of which a match needs, or None
+    provision_absence: array  # ProvisionId -> absence_is_flag
+    provision_required: array  # ProvisionId -> required_in as a DocumentType mask
+
+
+@lru_cache(maxsize=1)
+def get_flat_table() -> PatternTable:
+    """Flattens category -> provision -> pattern list into parallel arrays, once"""
+    _, provisions_by_id, provision_keys = get_provision_ids()
+    patterns, required_terms = [], []
+    kinds, provision_idx = array("B"), array("I")
+    for idx, pattern in enumerate(provisions_by_id):
+        for kind, field_name in _KIND_FIELDS:
+            for source in getattr(pattern, field_name):
+                patterns.append(_compile(source))
+                required_terms.append(_required_terms(source))
+                kinds.append(kind)
+                provision_idx.append(idx)
+    # Scores are 0-15 and severities 0-4, so both share one unsigned byte per provision
+    provision_score = array("B", (pattern.severity << 4 | pattern.base_risk_score for pattern in provisions_by_id))
+    provision_absence = array("B", (pattern.absence_is_flag for pattern in provisions_by_id))
+    provision_required = array("I", (pattern._required_mask for pattern in provisions_by_id))
+    return PatternTable(
+        provision_keys, tuple(patterns), kinds, provision_idx,
+        provision_score, tuple(required_terms),
+        provision_absence, provision_required,
+    )
+
+
+@lru_cache(maxsize=1)
+def _term_automaton():
+    """
+    Aho-Corasick automaton over every required term in the flat table, valued
+    with the term itself; None without pyahocorasick. Every prefilter term
+    comes from _required_terms() of a library pattern, so this covers them all.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for terms in get_flat_table().required_terms:
+        for term in terms or ():
+            automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=None)
+def _flat_rows(doc_type: Optional[DocumentType]) -> tuple:
+    """
+    (pattern, kind, provision_idx, required_terms) rows of the flat table,
+    limited to provisions applicable to doc_type
+    """
+    table = get_flat_table()
+    rows = zip(table.patterns, table.kinds, table.provision_idx, table.required_terms)
+    if doc_type is None:
+        return tuple(rows)
+    applicable = frozenset(get_patterns_by_doctype()[doc_type])
+    return tuple(row for row in rows if row[2] in applicable)
+
+
+# Directory where compiled Hyperscan databases are kept between runs, named by a
+# hash of their patterns; compiling the library's takes about a second. None
+# compiles them in every process.
+HYPERSCAN_CACHE_DIR: Optional[str] = None
+
+
+def _hyperscan_database(sources: list):
+    """
+    Block-mode Hyperscan database over sources, loaded from HYPERSCAN_CACHE_DIR
+    when a copy for the same sources is there; None if Hyperscan rejects them.
+    """
+    path = None
+    if HYPERSCAN_CACHE_DIR is not None:
+        digest = hashlib.sha256("\0".join(sources).encode()).hexdigest()
+        path = os.path.join(HYPERSCAN_CACHE_DIR, f"{digest}.hsdb")
+        try:
+            with open(path, "rb") as f:
+                return hyperscan.loadb(f.read(), hyperscan.HS_MODE_BLOCK)
+        except (OSError, hyperscan.error):
+            # Missing, unreadable or written by an incompatible Hyperscan: rebuild it
+            pass
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(
+            expressions=[source.encode() for source in sources],
+            ids=list(range(len(sources))),
+            elements=len(sources),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8] * len(sources),
+        )
+    except hyperscan.error:
+        return None
+    if path is not None:
+        # Write then rename, so a process starting concurrently never loads half a file
+        partial = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(HYPERSCAN_CACHE_DIR, exist_ok=True)
+            with open(partial, "wb") as f:
+                f.write(hyperscan.dumpb(database))
+            os.replace(partial, path)
+        except OSError:
+            # Read-only, full or missing cache directory: scan with the in-memory copy
+            try:
+                os.unlink(partial)
+            except OSError:
+                pass
+    return database
+
+
+def _hyperscan_matcher(sources: list) -> Optional[Callable]:
+    """
+    Compiles sources into one block-mode Hyperscan database and returns
+    text -> indices of the sources that match, or None if Hyperscan rejects them.
+    """
+    database = _hyperscan_database(sources)
+    if database is None:
+        return None
+    # Scratch space cannot be shared by concurrent scans; give each thread its own
+    local = threading.local()
+    
+    def match(text: str) -> list:
+        scratch = getattr(local, "scratch", None)
+        if scratch is None:
+            scratch = local.scratch = hyperscan.Scratch(database)
+        hits = []
+        database.scan(
+            text.encode(),
+            match_event_handler=lambda id, start, end, flags, context: hits.append(id),
+            scratch=scratch,
+        )
+        return hits
+    
+    return match
+
+
+def _re2_matcher(sources: list) -> Optional[Callable]:
+    """Compiles sources into one RE2 set and returns text -> indices of the sources that match"""
+    pattern_set = re2.Set.SearchSet()
+    for source in sources:
+        try:
+            pattern_set.Add(source)
+        except re2.error:
+            return None
+    pattern_set.Compile()
+    return lambda text: pattern_set.Match(text) or ()
+
+
+@lru_cache(maxsize=None)
+def _engine_plan(doc_type: Optional[DocumentType]) -> Optional[tuple]:
+    """
+    Splits _flat_rows(doc_type) into (match, set_rows, other_rows), where
+    match(text) returns indices into set_rows in one multi-pattern pass.
+    RE2 is preferred when installed: on contract-sized text its set search
+    measured faster than Hyperscan's per-match Python callbacks. None when
+    neither engine is installed.
+    """
+    if re2 is not None:
+        build, unsafe = _re2_matcher, (_ENGINE_UNSAFE, _BOUNDED_GAP)
+    elif hyperscan is not None:
+        build, unsafe = _hyperscan_matcher, (_ENGINE_UNSAFE, _BOUNDED_GAP)
+    else:
+        return None
+    set_rows, other_rows = [], []
+    for row in _flat_rows(doc_type):
+        source = row[0].pattern
+        (other_rows if any(check.search(source) for check in unsafe) else set_rows).append(row)
+    match = build([row[0].pattern for row in set_rows]) if set_rows else None
+    if match is None and set_rows:
+        # Some pattern uses syntax the engine rejects; test them one at a time
+        accepted = [row for row in set_rows if build([row[0].pattern]) is not None]
+        other_rows.extend(row for row in set_rows if row not in accepted)
+        set_rows = accepted
+        match = build([row[0].pattern for row in set_rows]) if set_rows else None
+    if match is None:
+        return None
+    return match, tuple(set_rows), tuple(other_rows)
+
+
+def _generate_row_matcher(name: str, rows: tuple) -> Callable:
+    """
+    Emits and compiles a function (lowered, terms, fired) -> fired that checks
+    rows in order against a ScanDocument's lowered text and terms, with each
+    row's provision index, kind bit and required terms inlined as constants;
+    the compiled patterns' search methods are globals.
+    """
+    namespace = {}
+    shared = {}
+    counts = {}
+    for row in rows:
+        counts[id(row[0])] = counts.get(id(row[0]), 0) + 1
+    lines = [f"def {name}(lowered, terms, fired):"]
+    for n, (pattern, kind, idx, terms) in enumerate(rows):
+        namespace[f"_search_{n}"] = pattern.search
+        # A list that already matched needs no further searches. Substring checks
+        # rule out most absent patterns without entering the regex engine.
+        conditions = [f"not fired[{idx}] & {kind}"]
+        if terms is not None:
+            conditions.append("(" + " or ".join(f"{term!r} in terms" for term in terms) + ")")
+        lines.append(f"    if {' and '.join(conditions)}:")
+        if counts[id(pattern)] == 1:
+            lines.append(f"        if _search_{n}(lowered):")
+        else:
+            # Provisions can share a pattern (the compile cache hands them the same
+            # object); each shared pattern is searched at most once per document
+            result = shared.get(id(pattern))
+            if result is None:
+                result = shared[id(pattern)] = f"found_{len(shared)}"
+                lines.insert(1, f"    {result} = None")
+            lines.append(f"        if {result} is None:")
+            lines.append(f"            {result} = _search_{n}(lowered) is not None")
+            lines.append(f"        if {result}:")
+        lines.append(f"            fired[{idx}] |= {kind}")
+    lines.append("    return fired")
+    exec(compile("\n".join(lines) + "\n", f"<generated {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+@lru_cache(maxsize=None)
+def _row_matcher(doc_type: Optional[DocumentType]) -> Callable:
+    """Generated matcher for the rows scan_flat() searches one by one for doc_type"""
+    plan = _engine_plan(doc_type)
+    rows = _flat_rows(doc_type) if plan is None else plan[2]
+    return _generate_row_matcher(f"_match_{'all' if doc_type is None else doc_type.name}", rows)
+
+
+# Number of scan_flat() results kept by document content, so re-scanning a
+# duplicate or an unchanged revision is one hash; 0 disables the cache
+FLAT_CACHE_SIZE = 4096
+
+# (digest of the scanned text, doc_type) -> bitmap, least recently used first
+_FLAT_RESULTS: OrderedDict = OrderedDict()
+_FLAT_RESULTS_LOCK = threading.Lock()
+
+
+def scan_flat(text: str, doc_type: Optional[DocumentType] = None) -> bytearray:
+    """
+    Returns one MatchKind bitmap byte per provision, indexed by ProvisionId.
+    With doc_type, provisions that do not apply to it are skipped and stay
+    zero. When Hyperscan or re2 is installed, every pattern it can run
+    identically is matched in one multi-pattern pass first; the rest run
+    through a matcher generated for doc_type's rows of the flat table.
+    Results for the last FLAT_CACHE_SIZE distinct documents are reused.
+    """
+    document = _as_document(text)
+    if not FLAT_CACHE_SIZE:
+        return _scan_flat(document, doc_type)
+    digest = hashlib.blake2b(document.lowered.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    key = (digest, doc_type)
+    with _FLAT_RESULTS_LOCK:
+        cached = _FLAT_RESULTS.get(key)
+        if cached is not None:
+            _FLAT_RESULTS.move_to_end(key)
+            return bytearray(cached)
+    fired = _scan_flat(document, doc_type)
+    with _FLAT_RESULTS_LOCK:
+        _FLAT_RESULTS[key] = bytes(fired)
+        while len(_FLAT_RESULTS) > FLAT_CACHE_SIZE:
+            _FLAT_RESULTS.popitem(last=False)
+    return fired
+
+
+def _scan_flat(document: ScanDocument, doc_type: Optional[DocumentType]) -> bytearray:
+    """scan_flat() without the result cache"""
+    fired = bytearray(len(get_flat_table().provision_keys))
+    plan = _engine_plan(doc_type)
+    if plan is not None:
+        match, set_rows, _ = plan
+        for i in match(document.engine_text):
+            _, kind, idx, _ = set_rows[i]
+            fired[idx] |= kind
+    # Patterns run on the lowered text as written. Rewriting \s+ to a literal space over
+    # whitespace-folded text measured no faster, and would let . and counted repeats
+    # span line breaks and whitespace runs they cannot span in the original.
+    return _row_matcher(doc_type)(document.lowered, document.terms, fired)
+
+
+# Maps a provision_score byte to its base_risk_score
+_RISK_NIBBLE = bytes(score & 0x0F for score in range(256))
+
+
+def score_flat(fired: bytearray) -> tuple:
+    """
+    Returns (summed base_risk_score, highest Severity) over the provisions set
+    in a scan_flat() bitmap; the Severity is None when no provision fired.
+    """
+    scores = bytes(compress(get_flat_table().provision_score, fired))
+    if not scores:
+        return 0, None
+    # Severity is the high nibble, so the largest packed byte carries the highest Severity
+    return sum(scores.translate(_RISK_NIBBLE)), Severity(max(scores) >> 4)
+
+
+@lru_cache(maxsize=None)
+def _absence_candidates(doc_type: DocumentType) -> tuple:
+    """ProvisionIds with absence_is_flag set and doc_type in required_in"""
+    table = get_flat_table()
+    bit = doc_type.value
+    return tuple(
+        pid
+        for pid, (absent, required) in enumerate(zip(table.provision_absence, table.provision_required))
+        if absent and required & bit
+    )
+
+
+def missing_flat(fired: bytearray, doc_type: DocumentType) -> list:
+    """
+    ProvisionIds flagged by their absence: absence_is_flag is set, doc_type is
+    in required_in, and no presence pattern matched in the scan_flat() bitmap.
+    Reads only the flat table's columns, never the DetectionPattern objects.
+    """
+    presence = MatchKind.PRESENCE.value
+    return [pid for pid in _absence_candidates(doc_type) if not fired[pid] & presence]
+
+
+def scan_batch(texts, workers: Optional[int] = None) -> tuple:
+    """
+    Scans many documents against the shared flat table. Returns (hits, risk):
+    hits[d] is the scan_flat() bitmap of texts[d] and risk[d] the summed
+    base_risk_score of the provisions with any match in it. texts may be any
+    iterable of documents. With workers > 1 they are scanned in that many
+    processes; call warm_up() first so forked workers inherit the compiled
+    tables.
+    """
+    if workers is not None and workers > 1:
+        texts = list(texts)
+        # A thread pool would not help: re keeps the GIL for the whole search
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            hits = list(pool.map(scan_flat, texts, chunksize=max(1, len(texts) // (workers * 4))))
+    else:
+        hits = [scan_flat(text) for text in texts]
+    risk = array("I", (score_flat(row)[0] for row in hits))
+    return hits, risk
+
+
+def missing_batch(hits, doc_types) -> list:
+    """
+    (d, ProvisionId) pairs, in document order, for the provisions flagged by
+    their absence in scan_batch() bitmap hits[d] of a document of type doc_types[d]
+    """
+    return [
+        (d, pid)
+        for d, (fired, doc_type) in enumerate(zip(hits, doc_types, strict=True))
+        for pid in missing_flat(fired, doc_type)
+    ]
+
+
+# =============================================================================
+# WARM-UP
+# =============================================================================
+
+def warm_up() -> None:
+    """
+    Builds the library and compiles every scanner table now instead of on the
+    first scan. Call it at service start-up, or in the parent process before
+    forking workers so they inherit the compiled patterns.
+    """
+    MAAProvisionLibrary.get_all_provisions()
+    get_flat_table()
+    for doc_type in (None, *DocumentType):
+        _engine_plan(doc_type)
+        _flat_rows(doc_type)
+        _row_matcher(doc_type)
+        if doc_type is not None:
+            _absence_candidates(doc_type)
+            _literal_owners(get_master_regex(doc_type)[1])
+    for section in _SECTION_BUILDERS:
+        _literal_owners(get_section_regex(section)[1])
+    _literal_automaton()
+    _term_automaton()
@@ -0,0 +1,363 @@
+import importlib.util
+import os
+import random
+import re
+import tempfile
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+
+import master_provision_taxonomy as mpt
+from master_provision_taxonomy import DocumentType, MatchKind
+
+
+_SAMPLE = """\
+STOCK PURCHASE AGREEMENT
+
+This Stock Purchase Agreement (this "Agreement") is entered into by and between Acme Holdings, Inc., a
+Delaware corporation organized under the laws of Delaware ("Buyer"), and BrightFuture Ltd. ("Seller"),
+hereinafter referred to as "Seller".
+
+ARTICLE I PURCHASE AND SALE. Buyer shall purchase all of the issued and outstanding shares of the Company.
+The Purchase Price shall be $25,000,000, subject to a working capital adjustment and a purchase price
+allocation under Section 1060. An amount equal to $2,500,000 shall be deposited in escrow with the Escrow
+Agent and held as an indemnity holdback for eighteen (18) months. Earn-out payments shall be determined
+based on EBITDA for the fiscal year, as reasonably determined by Buyer.
+
+ARTICLE II REPRESENTATIONS AND WARRANTIES. Seller represents and warrants that the financial statements
+fairly present the financial condition of the Company in accordance with GAAP. To Seller's knowledge there
+is no litigation pending. The Company has complied with all environmental laws, including CERCLA, and
+with GDPR and HIPAA. No Material Adverse Effect has occurred. "Material Adverse Effect" means any change
+that is material to the business, subject to customary carve-outs.
+
+ARTICLE III COVENANTS. Between signing and closing, Seller shall conduct the business in the ordinary
+course consistent with past practice. Seller shall not solicit, initiate or encourage any acquisition
+proposal (no-shop). Buyer shall have reasonable access to the premises, books and records. For a period of
+five (5) years Seller shall not compete with the business nor solicit any employee. Key employees shall
+enter into employment agreements. Exclusivity: Seller will not negotiate with other parties for 30 days.
+
+ARTICLE IV INDEMNIFICATION. Seller shall indemnify, defend and hold harmless Buyer from any losses arising
+out of any breach. The indemnification obligations are subject to a basket (deductible) of $250,000 and a
+cap of 10% of the Purchase Price, except for fraud and fundamental representations. Representations and
+warranties survive for eighteen months. The R&W insurance policy is the sole and exclusive remedy.
+
+ARTICLE V CONDITIONS AND TERMINATION. Closing is conditioned on HSR Act clearance, third-party consents
+and requisite stockholder approval. Either party may terminate if closing has not occurred by the outside
+date; a termination fee of $750,000 is payable. This Agreement is binding, except for confidentiality and
+exclusivity, which are non-binding. Governing law: Delaware. Any dispute shall be resolved by arbitration.
+"""
+
+# Whitespace str's \s matches that PDF and Word extraction commonly emit
+_SEPARATORS = (" ", "  ", "\n", "\t", "\xa0", "\x85", " ", " ", "　", " \xa0\n")
+
+_PATTERN_FIELDS = (
+    (MatchKind.PRESENCE, "presence_patterns"),
+    (MatchKind.VAGUE, "vague_patterns"),
+    (MatchKind.PROBLEMATIC, "problematic_patterns"),
+)
+
+
+def _library_vocabulary() -> list:
+    """Every required term and literal phrase the scanners look for"""
+    words = {term for terms in mpt.get_flat_table().required_terms for term in terms or ()}
+    for pattern in mpt.PROVISIONS_BY_ID:
+        words.update(pattern._presence_literals)
+    return sorted(words)
+
+
+def _word_salads(count: int, length: int) -> list:
+    """Seeded documents stitched together from library vocabulary and arbitrary separators"""
+    rng = random.Random(20260101)
+    vocabulary = _library_vocabulary() + ["the", "of", "shall", "not", "seller", "buyer", "100%", "$1,000", "."]
+    return [
+        "".join(rng.choice(vocabulary) + rng.choice(_SEPARATORS) for _ in range(length))
+        for _ in range(count)
+    ]
+
+
+def _corpus() -> list:
+    return [
+        "",
+        "merger",
+        _SAMPLE,
+        _SAMPLE.upper(),
+        _SAMPLE.replace(" ", "\xa0"),
+        _SAMPLE.replace(" ", " \n"),
+        # Characters re.IGNORECASE matches to ASCII letters that str.lower() alone does not
+        _SAMPLE.upper().replace("I", "İ"),
+        _SAMPLE.replace("i", "ı").replace("s", "ſ"),
+        # Not latin-1: CJK, Cyrillic and astral characters between the clauses
+        _SAMPLE.replace(". ", ". 合同条款 Договор 📄 "),
+        "Сделка: the ﬁnal 🙂 letter of intent is non‑binding; 株式 stock purchase agreement",
+        # Lone surrogates, left by broken pairs in PDF and JSON extraction
+        "Stock Purchase Agreement \ud83d indemnification",
+        _SAMPLE.replace(". ", ". \udc00\ud800 "),
+        *_word_salads(12, 300),
+    ]
+
+
+def _reference_kinds(text: str) -> bytearray:
+    """One MatchKind bitmap byte per ProvisionId, from a plain re.search over every pattern"""
+    fired = bytearray(len(mpt.PROVISIONS_BY_ID))
+    for pid, pattern in enumerate(mpt.PROVISIONS_BY_ID):
+        for kind, field_name in _PATTERN_FIELDS:
+            if any(re.search(p, text, re.IGNORECASE) for p in getattr(pattern, field_name)):
+                fired[pid] |= kind
+    return fired
+
+
+def _clear_engine_caches():
+    for cached in (mpt._engine_plan, mpt._row_matcher, mpt._literal_automaton, mpt._term_automaton):
+        cached.cache_clear()
+
+
+@contextmanager
+def _without_optional_engines():
+    """Runs the pure-re paths: generated row matcher and substring prefilters only"""
+    with mock.patch.multiple(mpt, re2=None, hyperscan=None, ahocorasick=None):
+        _clear_engine_caches()
+        try:
+            yield
+        finally:
+            _clear_engine_caches()
+
+
+class TestScannersMatchReference(unittest.TestCase):
+    """Every scanner must report exactly what a naive re.search loop over the library finds"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.corpus = _corpus()
+        cls.expected = [_reference_kinds(text) for text in cls.corpus]
+
+    def setUp(self):
+        # Results cached under one backend must not answer for another
+        patcher = mock.patch.object(mpt, "FLAT_CACHE_SIZE", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _cases(self):
+        return enumerate(zip(self.corpus, self.expected))
+
+    def test_scan_flat(self):
+        for i, (text, expected) in self._cases():
+            with self.subTest(document=i):
+                self.assertEqual(mpt.scan_flat(text), expected)
+
+    def test_scan_flat_by_doc_type(self):
+        for doc_type in DocumentType:
+            applicable = set(mpt.get_patterns_by_doctype()[doc_type])
+            for i, (text, expected) in self._cases():
+                with self.subTest(document=i):
+                    masked = bytearray(bits if pid in applicable else 0 for pid, bits in enumerate(expected))
+                    self.assertEqual(mpt.scan_flat(text, doc_type), masked, doc_type)
+
+    def test_scan_library(self):
+        for i, (text, expected) in self._cases():
+            with self.subTest(document=i):
+                self.assertEqual(
+                    mpt.scan_library(text),
+                    {mpt.PROVISION_KEYS[pid]: MatchKind(bits) for pid, bits in enumerate(expected) if bits},
+                )
+
+    def test_scan_presence(self):
+        for doc_type in DocumentType:
+            applicable = set(mpt.get_patterns_by_doctype()[doc_type])
+            for i, (text, expected) in self._cases():
+                with self.subTest(document=i):
+                    self.assertEqual(
+                        mpt.scan_presence(text, doc_type),
+                        {
+                            mpt.PROVISION_KEYS[pid]
+                            for pid, bits in enumerate(expected)
+                            if pid in applicable and bits & MatchKind.PRESENCE
+                        },
+                        doc_type,
+                    )
+
+    def test_scan_section(self):
+        for section in mpt.MAAProvisionLibrary.get_all_provisions():
+            keys = set(mpt.MAAProvisionLibrary.get_section(section))
+            for i, (text, expected) in self._cases():
+                with self.subTest(document=i):
+                    self.assertEqual(
+                        mpt.scan_section(text, section),
+                        {
+                            key
+                            for key, bits in zip(mpt.PROVISION_KEYS, expected)
+                            if key in keys and bits & MatchKind.PRESENCE
+                        },
+                        section,
+                    )
+
+    def test_scan_batch(self):
+        hits, risk = mpt.scan_batch(iter(self.corpus))
+        self.assertEqual(hits, self.expected)
+        self.assertEqual(list(risk), [mpt.score_flat(row)[0] for row in self.expected])
+
+
+class TestScannersWithoutOptionalEngines(TestScannersMatchReference):
+    """Same checks with re2, Hyperscan and pyahocorasick treated as not installed"""
+
+    def setUp(self):
+        super().setUp()
+        context = _without_optional_engines()
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+
+@unittest.skipIf(mpt.hyperscan is None, "hyperscan is not installed")
+class TestScannersWithHyperscan(TestScannersMatchReference):
+    """Same checks with Hyperscan as the multi-pattern engine, its databases cached on disk"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.cache_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls.cache_dir.cleanup)
+        # re2 is preferred whenever it is installed
+        patcher = mock.patch.multiple(mpt, re2=None, HYPERSCAN_CACHE_DIR=cls.cache_dir.name)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        _clear_engine_caches()
+        cls.addClassCleanup(_clear_engine_caches)
+
+    def test_engine_is_hyperscan(self):
+        self.assertIsNotNone(mpt._engine_plan(None))
+        self.assertTrue(any(name.endswith(".hsdb") for name in os.listdir(self.cache_dir.name)))
+
+    def test_corrupt_cache_files_are_rebuilt(self):
+        mpt._engine_plan(None)
+        for i, name in enumerate(sorted(os.listdir(self.cache_dir.name))):
+            path = os.path.join(self.cache_dir.name, name)
+            with open(path, "rb") as f:
+                data = f.read()
+            # Alternate between garbage and a database cut short mid-write
+            with open(path, "wb") as f:
+                f.write(b"not a hyperscan database" if i % 2 else data[:len(data) // 2])
+        _clear_engine_caches()
+        for i, (text, expected) in self._cases():
+            with self.subTest(document=i):
+                self.assertEqual(mpt.scan_flat(text), expected)
+        for name in os.listdir(self.cache_dir.name):
+            with open(os.path.join(self.cache_dir.name, name), "rb") as f:
+                mpt.hyperscan.loadb(f.read(), mpt.hyperscan.HS_MODE_BLOCK)
+
+
+@unittest.skipIf(mpt.re2 is None, "re2 is not installed")
+class TestScannersUnderUseRe2(unittest.TestCase):
+    """A copy of the module with USE_RE2 set before its library is built"""
+
+    @classmethod
+    def setUpClass(cls):
+        spec = importlib.util.spec_from_file_location("master_provision_taxonomy_use_re2", mpt.__file__)
+        cls.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cls.module)
+        cls.module.USE_RE2 = True
+        cls.module.FLAT_CACHE_SIZE = 0
+        cls.corpus = _corpus()
+        cls.expected = [_reference_kinds(text) for text in cls.corpus]
+
+    def test_library_compiles_with_re2(self):
+        kinds = {type(pattern).__module__.split(".")[0] for pattern in self.module.get_flat_table().patterns}
+        self.assertIn("re2", kinds)
+
+    def test_scanners(self):
+        module = self.module
+        keys = module.get_flat_table().provision_keys
+        for i, (text, expected) in enumerate(zip(self.corpus, self.expected)):
+            with self.subTest(document=i):
+                self.assertEqual(module.scan_flat(text), expected)
+                self.assertEqual(
+                    module.scan_library(text),
+                    {keys[pid]: module.MatchKind(bits) for pid, bits in enumerate(expected) if bits},
+                )
+                presence = {keys[pid] for pid, bits in enumerate(expected) if bits & MatchKind.PRESENCE}
+                for doc_type in module.DocumentType:
+                    applicable = {keys[pid] for pid in module.get_patterns_by_doctype()[doc_type]}
+                    self.assertEqual(module.scan_presence(text, doc_type), presence & applicable, doc_type)
+                for section in module.MAAProvisionLibrary.get_all_provisions():
+                    in_section = set(module.MAAProvisionLibrary.get_section(section))
+                    self.assertEqual(module.scan_section(text, section), presence & in_section, section)
+
+
+class TestScoring(unittest.TestCase):
+
+    def test_score_flat_matches_reference(self):
+        _, provisions_by_id, _ = mpt.get_provision_ids()
+        for i, fired in enumerate(map(_reference_kinds, _corpus())):
+            with self.subTest(document=i):
+                provisions = [p for p, bits in zip(provisions_by_id, fired) if bits]
+                self.assertEqual(
+                    mpt.score_flat(fired),
+                    (
+                        sum(p.base_risk_score for p in provisions),
+                        max((p.severity for p in provisions), default=None),
+                    ),
+                )
+
+    def test_empty_bitmap_has_no_severity(self):
+        self.assertEqual(mpt.score_flat(bytearray(len(mpt.PROVISION_KEYS))), (0, None))
+
+    def test_base_risk_score_must_fit_a_nibble(self):
+        for score in (-1, 16):
+            with self.subTest(score=score), self.assertRaises(ValueError):
+                mpt.DetectionPattern(
+                    name="x", description="", severity=mpt.Severity.LOW,
+                    category=mpt.Category.MISSING_PROVISION, base_risk_score=score,
+                )
+
+
+class TestAbsence(unittest.TestCase):
+    """The flat-table absence helpers must agree with a loop over the DetectionPattern objects"""
+
+    @classmethod
+    def setUpClass(cls):
+        _, cls.provisions_by_id, _ = mpt.get_provision_ids()
+        cls.hits = [_reference_kinds(text) for text in _corpus()]
+
+    def _reference_candidates(self, doc_type):
+        return [
+            pid
+            for pid, p in enumerate(self.provisions_by_id)
+            if p.absence_is_flag and doc_type in p.required_in
+        ]
+
+    def _reference_missing(self, fired, doc_type):
+        return [pid for pid in self._reference_candidates(doc_type) if not fired[pid] & MatchKind.PRESENCE]
+
+    def test_absence_candidates(self):
+        for doc_type in DocumentType:
+            with self.subTest(doc_type=doc_type):
+                self.assertEqual(list(mpt._absence_candidates(doc_type)), self._reference_candidates(doc_type))
+
+    def test_missing_flat(self):
+        for doc_type in DocumentType:
+            for i, fired in enumerate(self.hits):
+                with self.subTest(doc_type=doc_type, document=i):
+                    self.assertEqual(mpt.missing_flat(fired, doc_type), self._reference_missing(fired, doc_type))
+
+    def test_missing_batch(self):
+        doc_types = list(DocumentType)
+        batch_types = [doc_types[d % len(doc_types)] for d in range(len(self.hits))]
+        self.assertEqual(
+            mpt.missing_batch(self.hits, batch_types),
+            [
+                (d, pid)
+                for d, (fired, doc_type) in enumerate(zip(self.hits, batch_types))
+                for pid in self._reference_missing(fired, doc_type)
+            ],
+        )
+
+
+class TestScanCache(unittest.TestCase):
+
+    def test_cached_results_match_fresh_scans(self):
+        for text in _corpus()[:6]:
+            first = mpt.scan_flat(text)
+            self.assertEqual(mpt.scan_flat(text), first)
+            self.assertEqual(mpt.scan_flat(mpt.ScanDocument(text)), first)
+
+
+if __name__ == "__main__":
+    unittest.main()